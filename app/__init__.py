@@ -6,11 +6,16 @@ import os
 from flask import Flask, request, current_app
 from flask_cors import CORS
 from urllib.parse import urlparse
+from app.config import current_config
 from app.routes import bp
+from app.utils.json_provider import OrjsonProvider
 
 def create_app():
     """Create and configure the Flask application."""
+    current_config.setup_logging()
+    
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Configure CORS
     CORS(app, 
@@ -3,10 +3,12 @@ Application configuration module.
 """
 
 import os
+import sys
 import logging
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional
 
 @dataclass
 class Config:
@@ -17,11 +19,15 @@ class Config:
     BROWSER_HEADLESS: bool = True
     BROWSER_WINDOW_WIDTH: int = 1920
     BROWSER_WINDOW_HEIGHT: int = 1080
+    PAGE_RECYCLE_AFTER: int = 50  # Jobs a pooled Playwright page serves before it is replaced
     
     # Retry settings
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 2.0  # Base delay in seconds
+    RETRY_MAX_DELAY: float = 30.0  # Ceiling on any single backoff
     REQUEST_DELAY: float = 1.0  # Delay between requests
+    PER_HOST_CONCURRENCY: int = 2  # Requests in flight against any one host
+    PER_JOB_TIMEOUT: float = 60.0  # Seconds one job page may take, retries included
     
     # CSS Selectors for job listings
     SELECTORS: Dict[str, str] = field(default_factory=lambda: {
@@ -79,12 +85,22 @@ class Config:
     # Logging settings
     LOG_LEVEL: int = logging.INFO
     DEBUG: bool = False
+    SCRAPER_DEBUG: bool = os.getenv('SCRAPER_DEBUG') == '1'  # Save a screenshot and HTML of failed job pages
 
-    def setup_logging(self):
-        """Set up logging configuration."""
+    def setup_logging(self, log_file: Optional[str] = 'app.log'):
+        """
+        Set up logging configuration.
+        
+        Args:
+            log_file: File to mirror log output to; opened lazily on first write
+        """
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if log_file:
+            handlers.append(logging.FileHandler(log_file, delay=True))
         logging.basicConfig(
             level=self.LOG_LEVEL,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            handlers=handlers
         )
 
 class DevelopmentConfig(Config):
@@ -108,10 +124,13 @@ class ProductionConfig(Config):
     MAX_RETRIES: int = 5  # More retries in production
     CONCURRENT_WORKERS: int = 8  # More workers in production
 
+@lru_cache(maxsize=None)
 def get_config() -> Config:
     """
     Get application configuration.
     
+    The instance is built once per process and shared by every caller.
+    
     Returns:
         Config instance based on environment
     """
@@ -3,25 +3,13 @@ Flask routes for the job scraping API.
 """
 
 import logging
-import traceback
 import uuid
 from flask import Blueprint, request, jsonify
 from flask_cors import cross_origin
-from app.scraper.scraper import YCombinatorScraper
+from app.scraper.scraper import YCombinatorScraper, close_shared_browser
 import asyncio
-import sys
 from typing import Dict
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('app.log')
-    ]
-)
-
 logger = logging.getLogger(__name__)
 bp = Blueprint('routes', __name__)
 
@@ -29,14 +17,21 @@ bp = Blueprint('routes', __name__)
 jobs: Dict[str, dict] = {}
 
 def async_route(f):
-    """Decorator to run route handlers asynchronously."""
-    def wrapper(*args, **kwargs):
+    """
+    Decorator to run route handlers asynchronously.
+    
+    Each request runs on its own event loop. The shared browser launched on
+    that loop is closed before the loop is, so a server that starts a thread
+    per request doesn't leave a Chromium behind for every call.
+    """
+    async def run_and_release(*args, **kwargs):
         try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        return loop.run_until_complete(f(*args, **kwargs))
+            return await f(*args, **kwargs)
+        finally:
+            await close_shared_browser()
+    
+    def wrapper(*args, **kwargs):
+        return asyncio.run(run_and_release(*args, **kwargs))
     wrapper.__name__ = f.__name__
     return wrapper
 
@@ -124,8 +119,7 @@ async def start_scrape():
             
         except Exception as e:
             error_msg = f"Error scraping URL: {str(e)}"
-            logger.error(error_msg)
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(error_msg)
             jobs[job_id].update({
                 'status': 'error',
                 'error': error_msg
@@ -139,8 +133,7 @@ async def start_scrape():
             
     except Exception as e:
         error_msg = f"Server error: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(error_msg)
         return jsonify({
             "status": "error",
             "message": error_msg,
@@ -307,8 +300,7 @@ async def scrape_linkedin():
             
         except Exception as e:
             error_msg = f"Error scraping LinkedIn URLs: {str(e)}"
-            logger.error(error_msg)
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception(error_msg)
             response = jsonify({
                 "status": "error",
                 "message": error_msg,
@@ -327,8 +319,7 @@ async def scrape_linkedin():
             
     except Exception as e:
         error_msg = f"Server error: {str(e)}"
-        logger.error(error_msg)
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.exception(error_msg)
         response = jsonify({
             "status": "error",
             "message": error_msg,
@@ -2,194 +2,548 @@
 Core scraping functionality for Y Combinator job pages.
 """
 
+import atexit
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError, BrowserContext
-import traceback
-import sys
+import random
+import re
+import httpx
+import orjson
+from typing import AsyncIterator, List, Dict, Any, Final, Optional, Tuple
+from playwright.async_api import async_playwright, Page, Browser, TimeoutError, BrowserContext, Playwright, Route
+from selectolax.lexbor import LexborHTMLParser
+from collections import defaultdict
 from contextlib import asynccontextmanager
-
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('scraper.log')
-    ]
-)
+from urllib.parse import urljoin, urlparse, urlsplit
 
 from app.config import get_config
+from app.utils.retry_handler import jittered
 
 # Initialize logging
 logger = logging.getLogger(__name__)
 config = get_config()
 
+MAX_RETRIES: Final = config.MAX_RETRIES
+CONCURRENT_WORKERS: Final = config.CONCURRENT_WORKERS or 5
+MAX_BACKOFF: Final = config.RETRY_MAX_DELAY
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# Statuses that retrying or re-rendering will not fix
+PERMANENT_HTTP_STATUSES = frozenset({404, 410})
+
+# Resource types never needed for text extraction
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media', 'stylesheet'})
+
+# Tracker and analytics hosts; their beacons only hold up navigation
+BLOCKED_HOST_SUFFIXES = (
+    'google-analytics.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'segment.com',
+    'segment.io',
+    'hotjar.com',
+    'mixpanel.com',
+    'facebook.net',
+    'intercom.io',
+)
+
+# Default navigation budget; retries cover the occasional straggler
+NAVIGATION_TIMEOUT_MS = 15000
+
+LINKEDIN_URL_RE = re.compile(r'^https?://(?:[\w-]+\.)?linkedin\.com/', re.ASCII | re.IGNORECASE)
+
+# Selector fallbacks for each job detail field, tried in order
+DETAIL_SELECTORS: Dict[str, List[str]] = {
+    'title': ['h1', '.job-title', '.JobTitle', '.role-title', 'title'],
+    'company': ['.company-name', '.CompanyName', '.company-title', 'h2'],
+    'description': ['.job-description', '.JobDescription', 'article', 'main'],
+    'location': ['.job-location', '.JobLocation', '[data-test="job-location"]'],
+    'salary': ['.compensation', '.Compensation', '[data-test="compensation"]'],
+}
+
+# Title selectors that only match rendered content. The trailing <title>
+# fallback is present even on a client-side shell, so it can't decide whether
+# a page needs rendering
+CONTENT_TITLE_SELECTORS: List[str] = [s for s in DETAIL_SELECTORS['title'] if s != 'title']
+
+# Containers that hold the founders block on a job page
+FOUNDERS_SECTION_SELECTOR = '.Founders, [class*="founder"], [class*="Founder"]'
+
+# Anchors to individual job pages on a company's listing page, tried in order
+JOB_LINK_SELECTORS: List[str] = [
+    'a[href*="/companies/"][href*="/jobs/"]',
+    '.job-listing a',
+    '.JobListing a',
+    'article a[href*="/jobs/"]',
+]
+
+# Page-side extractors, installed once per context with add_init_script so
+# each page.evaluate only ships a short call over CDP. The selector tables are
+# serialized from the Python constants above so both paths stay in sync.
+EXTRACTORS_JS = "window.__weaverSelectors = " + orjson.dumps({
+    'details': DETAIL_SELECTORS,
+    'jobLinks': JOB_LINK_SELECTORS,
+}).decode() + """;
+
+window.__weaverExtractDetails = () => {
+    const FIELDS = window.__weaverSelectors.details;
+
+    // Each selector hits the selector engine at most once
+    const cache = new Map();
+    function query(selector) {
+        if (!cache.has(selector)) {
+            let element = null;
+            try {
+                element = document.querySelector(selector);
+            } catch (e) {
+                console.error(`Error extracting ${selector}:`, e);
+            }
+            cache.set(selector, element);
+        }
+        return cache.get(selector);
+    }
+
+    const details = {};
+    for (const [field, selectors] of Object.entries(FIELDS)) {
+        details[field] = '';
+        for (const selector of selectors) {
+            const element = query(selector);
+            const value = element ? element.textContent.trim() : '';
+            if (value) {
+                details[field] = value;
+                break;
+            }
+        }
+    }
+    return JSON.stringify(details);
+};
+
+window.__weaverExtractJobUrls = () => {
+    // One walk over the union of the selectors; the first selector with any
+    // match still wins, picked from that set with matches()
+    const selectors = window.__weaverSelectors.jobLinks;
+    const candidates = Array.from(document.querySelectorAll(selectors.join(', ')));
+    if (candidates.length === 0) {
+        return [];
+    }
+    for (const selector of selectors) {
+        const elements = candidates.filter(el => el.matches(selector));
+        if (elements.length > 0) {
+            // Dedupe in the page so duplicates never cross the CDP bridge
+            return [...new Set(elements
+                .map(el => el.href)
+                .filter(url => url && url.includes('/jobs/')))];
+        }
+    }
+    return [];
+};
+
+window.__weaverExtractLinkedin = () => {
+    function safeExtract(selectors, attribute = 'textContent') {
+        for (const selector of selectors) {
+            try {
+                const element = document.querySelector(selector);
+                if (element) {
+                    const value = attribute === 'textContent' ?
+                        element.textContent.trim() :
+                        element.getAttribute(attribute);
+                    if (value) return value;
+                }
+            } catch (e) {
+                console.error(`Error extracting ${selector}:`, e);
+            }
+        }
+        return '';
+    }
+
+    // Extract all founder names
+    const founderNames = [];
+    document.querySelectorAll('.Founders h3, [class*="founder"] h3, .Founder h3').forEach(el => {
+        if (el && el.textContent) {
+            founderNames.push(el.textContent.trim());
+        }
+    });
+
+    // Function to check if a URL is likely a founder profile
+    function isFounderUrl(url, names) {
+        if (!url || !names || names.length === 0) return false;
+
+        // Convert URL to lowercase for case-insensitive matching
+        const lowerUrl = url.toLowerCase();
+
+        // Check if any founder name appears in the URL
+        return names.some(name => {
+            if (!name) return false;
+
+            // Split name into parts
+            const nameParts = name.toLowerCase().split(' ');
+
+            // Check if any part of the name (at least 3 chars) is in the URL
+            return nameParts.some(part => part.length > 2 && lowerUrl.includes(part));
+        });
+    }
+
+    // Extract founder LinkedIn URLs (from Founders section, or near founder names)
+    const foundersSection = document.querySelector('.Founders, [class*="founder"], [class*="Founder"]');
+    const founderLinks = foundersSection ?
+        Array.from(foundersSection.querySelectorAll('a[href*="linkedin.com"]')).map(a => a.href) : [];
+
+    // Extract all LinkedIn URLs from the page
+    const allLinkedinUrls = Array.from(document.querySelectorAll('a[href*="linkedin.com"]'))
+        .map(a => a.href)
+        .filter(url => url && url.includes('linkedin.com'));
+
+    // Categorize LinkedIn URLs
+    let founderLinkedinUrls = founderLinks;
+
+    // If no founder LinkedIn URLs found directly, try to identify them by name
+    if (founderLinkedinUrls.length === 0 && founderNames.length > 0) {
+        founderLinkedinUrls = allLinkedinUrls.filter(url => isFounderUrl(url, founderNames));
+    }
+
+    // Remaining URLs are likely company URLs
+    const companyLinkedinUrls = allLinkedinUrls.filter(url => !founderLinkedinUrls.includes(url));
+
+    return JSON.stringify({
+        title: safeExtract(window.__weaverSelectors.details.title),
+        company: safeExtract(window.__weaverSelectors.details.company),
+        linkedin_urls: allLinkedinUrls,
+        founder_linkedin_urls: founderLinkedinUrls,
+        company_linkedin_urls: companyLinkedinUrls,
+        founder_names: founderNames
+    });
+};
+"""
+
+class PageGoneError(Exception):
+    """Raised when a page answers with a permanent failure status."""
+
+def validate_linkedin_url(url: str) -> Optional[str]:
+    """Return the URL if it points at linkedin.com, otherwise None."""
+    return url if url and LINKEDIN_URL_RE.match(url) else None
+
+def is_blocked_host(host: str) -> bool:
+    """Check whether a host is one of BLOCKED_HOST_SUFFIXES or a subdomain of one."""
+    return any(host == suffix or host.endswith('.' + suffix) for suffix in BLOCKED_HOST_SUFFIXES)
+
+def canonical_job_url(href: str, base_url: str) -> str:
+    """Resolve a job link against the listing URL and drop its query and fragment."""
+    return urlsplit(urljoin(base_url, href))._replace(query='', fragment='').geturl()
+
+def first_text(tree: LexborHTMLParser, selectors: List[str]) -> str:
+    """Return the trimmed textContent of the first selector that matches non-empty."""
+    for selector in selectors:
+        node = tree.css_first(selector)
+        # text(strip=True) strips every text node, gluing inline markup
+        # together ("Senior <b>Backend</b>" -> "SeniorBackend")
+        value = node.text().strip() if node else ''
+        if value:
+            return value
+    return ''
+
+def is_founder_url(url: str, names: List[str]) -> bool:
+    """Check whether any part of a founder's name (3+ chars) appears in the URL."""
+    lower_url = url.lower()
+    return any(
+        len(part) > 2 and part in lower_url
+        for name in names if name
+        for part in name.lower().split(' ')
+    )
+
+def backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """
+    Compute how long to wait before the next navigation attempt.
+    
+    Args:
+        attempt: Zero-based index of the attempt that just failed
+        retry_after: Retry-After header from a 429 response, if any
+        
+    Returns:
+        Delay in seconds: the server's Retry-After when it sent one, otherwise
+        capped exponential backoff with jitter so concurrent retries spread out
+    """
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), MAX_BACKOFF)
+    # Proportional jitter: a fixed additive spread is lost once delays reach
+    # several seconds, leaving workers that failed together still in step
+    return jittered(config.RETRY_DELAY * 2 ** attempt)
+
+CHROMIUM_ARGS = [
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-software-rasterizer',
+    '--disable-setuid-sandbox',
+    '--no-first-run',
+    '--window-size=1920,1080',
+    # Nothing we extract needs images, media or background services
+    '--blink-settings=imagesEnabled=false',
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter,OptimizationHints',
+    '--disable-background-networking',
+    '--disable-renderer-backgrounding',
+    '--mute-audio'
+]
+
+# One Playwright driver and browser per event loop, shared by every scrape
+# and extractor running on it. Playwright objects are bound to the loop that
+# created them; async_route gives each request its own loop and closes that
+# loop's browser when the request finishes.
+_shared_browsers: Dict[asyncio.AbstractEventLoop, Tuple[Playwright, Browser]] = {}
+_shared_browser_locks: Dict[asyncio.AbstractEventLoop, asyncio.Lock] = {}
+
+async def get_shared_browser() -> Browser:
+    """
+    Get the running loop's browser, launching it on first use.
+    
+    Returns:
+        A connected browser; a crashed one is replaced transparently
+    """
+    loop = asyncio.get_running_loop()
+    lock = _shared_browser_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        entry = _shared_browsers.get(loop)
+        if entry and entry[1].is_connected():
+            return entry[1]
+        if entry:
+            await entry[0].stop()
+        
+        playwright = await async_playwright().start()
+        browser = await playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        _shared_browsers[loop] = (playwright, browser)
+        logger.info("Launched shared browser")
+        return browser
+
+async def close_shared_browser() -> None:
+    """Close the running loop's browser and stop its Playwright driver."""
+    loop = asyncio.get_running_loop()
+    _shared_browser_locks.pop(loop, None)
+    entry = _shared_browsers.pop(loop, None)
+    if entry:
+        playwright, browser = entry
+        await browser.close()
+        await playwright.stop()
+        logger.info("Closed shared browser")
+
+def _close_shared_browsers_at_exit() -> None:
+    """Best-effort shutdown of browsers whose loops are idle at interpreter exit."""
+    for loop in list(_shared_browsers):
+        if loop.is_closed() or loop.is_running():
+            continue
+        try:
+            loop.run_until_complete(close_shared_browser())
+        except Exception as e:
+            logger.warning(f"Error closing shared browser: {str(e)}")
+
+atexit.register(_close_shared_browsers_at_exit)
+
 class YCombinatorScraper:
     """Scrapes job listings from Y Combinator."""
     
     def __init__(self):
         """Initialize the job scraper."""
         self.config = config
-        self.playwright = None
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
+        self.http: Optional[httpx.AsyncClient] = None
+        self._idle_pages: List[Page] = []  # warm pages on the shared context
+        self._page_uses: Dict[Page, int] = {}  # jobs served by each idle page
+        self._host_semaphores = defaultdict(
+            lambda: asyncio.Semaphore(self.config.PER_HOST_CONCURRENCY)
+        )
         self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
 
     @asynccontextmanager
     async def browser_context(self):
         """Context manager for browser initialization and cleanup."""
         try:
-            self.playwright = await async_playwright().start()
-            self.browser = await self.playwright.chromium.launch(
-                headless=True,
-                args=[
-                    '--no-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-extensions',
-                    '--disable-software-rasterizer',
-                    '--disable-setuid-sandbox',
-                    '--no-first-run',
-                    '--no-zygote',
-                    '--single-process',
-                    '--window-size=1920,1080'
-                ]
-            )
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            self.browser = await get_shared_browser()
+            self.context = await self._new_context()
+            self.http = httpx.AsyncClient(
+                http2=True,
+                headers={'User-Agent': USER_AGENT},
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=10,
+                follow_redirects=True
             )
             self.logger.info("Browser context initialized successfully")
             yield
         except Exception as e:
-            self.logger.error(f"Failed to initialize browser: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Failed to initialize browser: {str(e)}")
             raise
         finally:
+            if self.http:
+                await self.http.aclose()
+            self._idle_pages.clear()  # closed along with the shared context
+            self._page_uses.clear()
             if self.context:
                 await self.context.close()
-            if self.browser:
-                await self.browser.close()
-            if self.playwright:
-                await self.playwright.stop()
+            # The browser itself stays up for the next scrape on this loop
             self.logger.info("Browser resources cleaned up")
 
-    async def _get_page(self) -> Page:
-        """Get a new page instance."""
-        if not self.context:
+    async def _new_context(self) -> BrowserContext:
+        """Create a fresh, isolated browser context on the shared browser."""
+        if not self.browser:
+            raise RuntimeError("Browser not initialized")
+        
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent=USER_AGENT
+        )
+        context.set_default_navigation_timeout(NAVIGATION_TIMEOUT_MS)
+        await context.route("**/*", self._route_filter)
+        await context.add_init_script(EXTRACTORS_JS)
+        return context
+
+    async def _route_filter(self, route: Route) -> None:
+        """Abort requests for resources the scraper never reads."""
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or is_blocked_host(urlparse(request.url).hostname or '')):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def _get_page(self, context: Optional[BrowserContext] = None) -> Page:
+        """Get a new page instance, defaulting to the shared context."""
+        context = context or self.context
+        if not context:
             raise RuntimeError("Browser context not initialized")
         
         try:
-            page = await self.context.new_page()
+            page = await context.new_page()
             
-            # Enable request/response logging
-            page.on("request", lambda request: self.logger.debug(f"Request: {request.method} {request.url}"))
-            page.on("response", lambda response: self.logger.debug(f"Response: {response.status} {response.url}"))
+            # Only trace every subresource when debug logging is actually on
+            if self.logger.isEnabledFor(logging.DEBUG):
+                page.on("request", lambda request: self.logger.debug("Request: %s %s", request.method, request.url))
+                page.on("response", lambda response: self.logger.debug("Response: %s %s", response.status, response.url))
             
             return page
         except Exception as e:
-            self.logger.error(f"Error creating page: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error creating page: {str(e)}")
             raise
     
-    async def wait_for_network_idle(self, page: Page, timeout: int = 30000):
-        """Wait for network to be idle."""
+    @asynccontextmanager
+    async def _lease_page(self):
+        """
+        Borrow a page on the shared context, reusing one left idle by an earlier job.
+        
+        Pages are blanked before going back to the pool, and kept only up to
+        CONCURRENT_WORKERS; the rest are closed. A page is also closed once it
+        has served PAGE_RECYCLE_AFTER jobs, so renderer memory can't grow unbounded.
+        """
+        page = self._idle_pages.pop() if self._idle_pages else await self._get_page()
+        uses = self._page_uses.pop(page, 0) + 1
+        reusable = False
+        try:
+            yield page
+            reusable = uses < self.config.PAGE_RECYCLE_AFTER
+        finally:
+            if reusable and not page.is_closed() and len(self._idle_pages) < CONCURRENT_WORKERS:
+                try:
+                    await page.goto('about:blank')
+                    self._idle_pages.append(page)
+                    self._page_uses[page] = uses
+                except Exception:
+                    await page.close()
+            elif not page.is_closed():
+                await page.close()
+
+    @asynccontextmanager
+    async def _host_slot(self, url: str):
+        """
+        Hold one of the per-host request slots, pausing briefly before the request.
+        
+        Take it before a global slot, so tasks queued on a busy host don't
+        hold global slots that requests to other hosts could use.
+        """
+        async with self._host_semaphores[urlparse(url).netloc]:
+            await asyncio.sleep(random.uniform(0.1, 0.3))
+            yield
+
+    async def _fetch_details_http(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch job details over plain HTTP for server-rendered pages.
+        
+        Returns:
+            Extracted details, or None if the page needs a browser render
+        """
+        if not self.http:
+            return None
+        
         try:
-            await page.wait_for_load_state('networkidle', timeout=timeout)
-        except TimeoutError:
-            self.logger.warning("Network idle timeout reached")
+            response = await self.http.get(job_url)
+            if response.status_code in PERMANENT_HTTP_STATUSES:
+                raise PageGoneError(f"{job_url} returned HTTP {response.status_code}")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.logger.debug(f"HTTP fetch failed for {job_url}: {str(e)}")
+            return None
+        
+        tree = LexborHTMLParser(response.text)
+        # Without a title in the content the page most likely renders client-side
+        if not first_text(tree, CONTENT_TITLE_SELECTORS):
+            return None
+        return {field: first_text(tree, selectors) for field, selectors in DETAIL_SELECTORS.items()}
 
     async def scrape_job_details(self, job_url: str) -> Dict[str, Any]:
         """Scrape detailed information from a job listing page."""
-        page = await self._get_page()
+        context = None
         try:
+            # Try the lightweight HTTP path first, only rendering when needed
+            details = await self._fetch_details_http(job_url)
+            if details:
+                self.logger.info(f"Extracted details for {job_url} without a browser")
+                return details
+            
+            # Each job gets its own context so concurrent scrapes don't share
+            # cookies, storage or navigation state
+            context = await self._new_context()
+            page = await self._get_page(context)
             self.logger.info(f"Scraping job details from {job_url}")
             
             # Navigate to the page with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
+            for attempt in range(MAX_RETRIES):
                 try:
-                    await page.goto(job_url, wait_until='domcontentloaded', timeout=30000)
-                    await self.wait_for_network_idle(page)
-                    break
+                    # Return on the first response byte; the selector waits
+                    # below block only on the nodes we actually read
+                    response = await page.goto(job_url, wait_until='commit')
                 except TimeoutError:
-                    if attempt == max_retries - 1:
+                    if attempt == MAX_RETRIES - 1:
                         raise
                     self.logger.warning(f"Timeout on attempt {attempt + 1}, retrying...")
-                    await asyncio.sleep(2)
+                    await asyncio.sleep(backoff_delay(attempt))
+                    continue
+                if response and response.status in PERMANENT_HTTP_STATUSES:
+                    raise PageGoneError(f"{job_url} returned HTTP {response.status}")
+                if response and response.status == 429 and attempt < MAX_RETRIES - 1:
+                    self.logger.warning(f"Rate limited on attempt {attempt + 1}, backing off...")
+                    await asyncio.sleep(backoff_delay(attempt, response.headers.get('retry-after')))
+                    continue
+                break
 
-            # Wait for content to load
+            # Wait for the content we extract rather than a fixed delay
             await page.wait_for_selector('main', timeout=10000)
-            await page.wait_for_timeout(2000)
+            try:
+                await page.wait_for_selector(', '.join(CONTENT_TITLE_SELECTORS), timeout=5000)
+            except TimeoutError:
+                self.logger.warning(f"Job title not found on {job_url}, extracting anyway")
 
             # Log the page title and URL
             title = await page.title()
             self.logger.info(f"Page loaded: {title} ({page.url})")
 
-            # Extract job details using JavaScript
-            details = await page.evaluate("""
-                () => {
-                    function safeExtract(selectors, attribute = 'textContent') {
-                        for (const selector of selectors) {
-                            try {
-                                const element = document.querySelector(selector);
-                                if (element) {
-                                    const value = attribute === 'textContent' ? 
-                                        element.textContent.trim() : 
-                                        element.getAttribute(attribute);
-                                    if (value) return value;
-                                }
-                            } catch (e) {
-                                console.error(`Error extracting ${selector}:`, e);
-                            }
-                        }
-                        return '';
-                    }
-
-                    return {
-                        title: safeExtract([
-                            'h1',
-                            '.job-title',
-                            '.JobTitle',
-                            '.role-title',
-                            'title'
-                        ]),
-                        company: safeExtract([
-                            '.company-name',
-                            '.CompanyName',
-                            '.company-title',
-                            'h2'
-                        ]),
-                        description: safeExtract([
-                            '.job-description',
-                            '.JobDescription',
-                            'article',
-                            'main'
-                        ]),
-                        location: safeExtract([
-                            '.job-location',
-                            '.JobLocation',
-                            '[data-test="job-location"]'
-                        ]),
-                        salary: safeExtract([
-                            '.compensation',
-                            '.Compensation',
-                            '[data-test="compensation"]'
-                        ])
-                    };
-                }
-            """)
+            # Extract job details using JavaScript; the payload comes back as a
+            # JSON string so it can be decoded with orjson instead of the stock decoder
+            details = orjson.loads(await page.evaluate("() => window.__weaverExtractDetails()"))
 
             self.logger.info(f"Successfully extracted details for {job_url}")
             self.logger.debug(f"Extracted details: {details}")
             return details
 
         except Exception as e:
-            self.logger.error(f"Error scraping job details from {job_url}: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error scraping job details from {job_url}: {str(e)}")
             return {
                 'title': '',
                 'company': '',
@@ -199,95 +553,201 @@ class YCombinatorScraper:
                 'error': str(e)
             }
         finally:
-            await page.close()
+            if context:
+                await context.close()
 
     async def scrape_job_listings(self, url: str) -> list:
         """Scrape job listings from the main page."""
         page = await self._get_page()
         try:
             self.logger.info(f"Navigating to {url}")
-            await page.goto(url, wait_until='domcontentloaded', timeout=30000)
-            await self.wait_for_network_idle(page)
+            await page.goto(url, wait_until='commit')
             
             # Wait for job listings to load
             await page.wait_for_selector('main', timeout=10000)
-            await page.wait_for_timeout(2000)
+            try:
+                await page.wait_for_selector(JOB_LINK_SELECTORS[0], timeout=5000)
+            except TimeoutError:
+                self.logger.warning(f"No company job links appeared on {url}, extracting anyway")
 
             # Extract job URLs
-            job_urls = await page.evaluate("""
-                () => {
-                    const selectors = [
-                        'a[href*="/companies/"][href*="/jobs/"]',
-                        '.job-listing a',
-                        '.JobListing a',
-                        'article a[href*="/jobs/"]'
-                    ];
-                    
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        if (elements.length > 0) {
-                            return Array.from(elements)
-                                .map(el => el.href)
-                                .filter(url => url && url.includes('/jobs/'));
-                        }
-                    }
-                    return [];
-                }
-            """)
+            job_urls = await page.evaluate("() => window.__weaverExtractJobUrls()")
 
             if not job_urls:
                 self.logger.warning("No job URLs found")
                 return []
 
-            # Make sure all URLs are properly formatted strings
+            # Make sure all URLs are properly formatted strings, canonicalized so
+            # tracking params or relative links don't defeat the dedup below
             cleaned_urls = []
             for job_url in job_urls:
-                if isinstance(job_url, str) and job_url.startswith('http'):
-                    cleaned_urls.append(job_url)
+                if isinstance(job_url, str) and job_url.startswith(('http', '/')):
+                    cleaned_urls.append(canonical_job_url(job_url, url))
                 else:
                     self.logger.warning(f"Skipping invalid job URL: {job_url}")
             
             self.logger.info(f"Found {len(cleaned_urls)} valid job URLs")
-            return list(set(cleaned_urls))  # Remove duplicates
+            return list(dict.fromkeys(cleaned_urls))  # Remove duplicates, keeping discovery order
 
         except Exception as e:
-            self.logger.error(f"Error scraping job listings: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error scraping job listings: {str(e)}")
             return []
         finally:
             await page.close()
 
-    async def scrape(self, url: str) -> list:
-        """Main scraping function."""
-        results = []
-        try:
-            async with self.browser_context():
-                # Get job listings
-                job_urls = await self.scrape_job_listings(url)
-                if not job_urls:
-                    return []
+    async def iter_scrape(self, url: str, max_concurrency: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape job details, yielding each job as soon as it is done.
+        
+        Args:
+            url: Job listings page to scrape
+            max_concurrency: Job pages in flight at once, defaults to CONCURRENT_WORKERS
+            
+        Yields:
+            Details for each job scraped successfully, in completion order
+        """
+        async with self.browser_context():
+            # Get job listings
+            job_urls = await self.scrape_job_listings(url)
+            if not job_urls:
+                return
 
-                # Scrape job details with rate limiting
-                for job_url in job_urls:
+            # Scrape job details concurrently; the semaphore bounds how many
+            # pages are in flight at once, the host slots how many hit one host
+            semaphore = asyncio.Semaphore(max_concurrency or CONCURRENT_WORKERS)
+
+            async def _bounded(job_url: str) -> Optional[Dict[str, Any]]:
+                async with self._host_slot(job_url), semaphore:
                     try:
-                        details = await self.scrape_job_details(job_url)
-                        if details:
-                            results.append(details)
-                        # Rate limiting
-                        await asyncio.sleep(1)
+                        return await asyncio.wait_for(
+                            self.scrape_job_details(job_url), timeout=self.config.PER_JOB_TIMEOUT
+                        )
+                    except asyncio.TimeoutError:
+                        self.logger.warning(f"Skipping {job_url}: no result within {self.config.PER_JOB_TIMEOUT}s")
                     except Exception as e:
                         self.logger.error(f"Error processing job {job_url}: {str(e)}")
-                        continue
+                    return None
 
+            tasks = [asyncio.create_task(_bounded(job_url)) for job_url in job_urls]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    details = await next_done
+                    if details:
+                        yield details
+            finally:
+                # The consumer may stop early; don't leave jobs running on a closing browser
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def scrape(self, url: str, max_concurrency: Optional[int] = None) -> list:
+        """
+        Main scraping function.
+        
+        Args:
+            url: Job listings page to scrape
+            max_concurrency: Job pages in flight at once, defaults to CONCURRENT_WORKERS
+            
+        Returns:
+            Details for every job that was scraped successfully, in completion order
+        """
+        results = []
+        try:
+            async for details in self.iter_scrape(url, max_concurrency):
+                results.append(details)
         except Exception as e:
-            self.logger.error(f"Error in scrape process: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error in scrape process: {str(e)}")
             
         return results 
 
+    async def _fetch_linkedin_http(self, job_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract LinkedIn URLs over plain HTTP for server-rendered pages.
+        
+        Mirrors window.__weaverExtractLinkedin on the raw HTML.
+        
+        Returns:
+            Extracted data, or None if the page needs a browser render
+        """
+        if not self.http:
+            return None
+        
+        try:
+            response = await self.http.get(job_url)
+            if response.status_code in PERMANENT_HTTP_STATUSES:
+                raise PageGoneError(f"{job_url} returned HTTP {response.status_code}")
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            self.logger.debug(f"HTTP fetch failed for {job_url}: {str(e)}")
+            return None
+        
+        tree = LexborHTMLParser(response.text)
+        all_urls = [
+            href for node in tree.css('a[href*="linkedin.com"]')
+            if (href := node.attributes.get('href'))
+        ]
+        if not all_urls:
+            return None
+        
+        founder_names = [
+            name
+            for node in tree.css('.Founders h3, [class*="founder"] h3, .Founder h3')
+            if (name := node.text().strip())
+        ]
+        founders_section = tree.css_first(FOUNDERS_SECTION_SELECTOR)
+        founder_urls = [
+            href for node in (founders_section.css('a[href*="linkedin.com"]') if founders_section else [])
+            if (href := node.attributes.get('href'))
+        ]
+        if not founder_urls and founder_names:
+            founder_urls = [u for u in all_urls if is_founder_url(u, founder_names)]
+        # Site-wide links (a footer icon, say) are not enough: without founder
+        # links the founders block most likely hydrates client-side
+        if not founder_urls:
+            return None
+        founder_set = set(founder_urls)
+        
+        return {
+            'title': first_text(tree, DETAIL_SELECTORS['title']),
+            'company': first_text(tree, DETAIL_SELECTORS['company']),
+            'linkedin_urls': all_urls,
+            'founder_linkedin_urls': founder_urls,
+            'company_linkedin_urls': [u for u in all_urls if u not in founder_set],
+            'founder_names': founder_names
+        }
+
+    async def _render_linkedin(self, job_url: str) -> Dict[str, Any]:
+        """Render a job page on a pooled page and run the LinkedIn extractor."""
+        async with self._lease_page() as page:
+            # Navigate to the page with retry logic
+            for attempt in range(MAX_RETRIES):
+                try:
+                    response = await page.goto(job_url, wait_until='domcontentloaded')
+                    if response and response.status in PERMANENT_HTTP_STATUSES:
+                        raise PageGoneError(f"{job_url} returned HTTP {response.status}")
+                    break
+                except TimeoutError:
+                    if attempt == MAX_RETRIES - 1:
+                        raise
+                    self.logger.warning(f"Timeout on attempt {attempt + 1}, retrying...")
+                    await asyncio.sleep(backoff_delay(attempt))
+
+            # Wait for content to load
+            await page.wait_for_selector('main', timeout=10000)
+            try:
+                # The founders block hydrates after the main content
+                await page.wait_for_selector(
+                    f'{FOUNDERS_SECTION_SELECTOR}, a[href*="linkedin.com"]', state='attached', timeout=5000
+                )
+            except TimeoutError:
+                self.logger.warning(f"No founders section on {job_url}, extracting anyway")
+
+            # Extract basic job info and all LinkedIn URLs (returned as a JSON string
+            # and decoded with orjson, as this is the largest payload we pull back)
+            return orjson.loads(await page.evaluate("() => window.__weaverExtractLinkedin()"))
+
     async def extract_linkedin_urls(self, job_url: str) -> Dict[str, Any]:
         """Extract LinkedIn URLs from a job page."""
-        page = await self._get_page()
         try:
             self.logger.info(f"Extracting LinkedIn URLs from {job_url}")
             
@@ -303,120 +763,20 @@ class YCombinatorScraper:
                     'error': f"Invalid job URL type: {type(job_url)}"
                 }
             
-            # Navigate to the page with retry logic
-            max_retries = 3
-            for attempt in range(max_retries):
-                try:
-                    await page.goto(job_url, wait_until='domcontentloaded', timeout=30000)
-                    await self.wait_for_network_idle(page)
-                    break
-                except TimeoutError:
-                    if attempt == max_retries - 1:
-                        raise
-                    self.logger.warning(f"Timeout on attempt {attempt + 1}, retrying...")
-                    await asyncio.sleep(2)
-
-            # Wait for content to load
-            await page.wait_for_selector('main', timeout=10000)
-            await page.wait_for_timeout(3000)  # Extended wait time to ensure founders section loads
-
-            # Extract basic job info and all LinkedIn URLs
-            data = await page.evaluate("""
-                () => {
-                    function safeExtract(selectors, attribute = 'textContent') {
-                        for (const selector of selectors) {
-                            try {
-                                const element = document.querySelector(selector);
-                                if (element) {
-                                    const value = attribute === 'textContent' ? 
-                                        element.textContent.trim() : 
-                                        element.getAttribute(attribute);
-                                    if (value) return value;
-                                }
-                            } catch (e) {
-                                console.error(`Error extracting ${selector}:`, e);
-                            }
-                        }
-                        return '';
-                    }
-                    
-                    // Extract all founder names
-                    const founderNames = [];
-                    document.querySelectorAll('.Founders h3, [class*="founder"] h3, .Founder h3').forEach(el => {
-                        if (el && el.textContent) {
-                            founderNames.push(el.textContent.trim());
-                        }
-                    });
-                    
-                    // Function to check if a URL is likely a founder profile
-                    function isFounderUrl(url, names) {
-                        if (!url || !names || names.length === 0) return false;
-                        
-                        // Convert URL to lowercase for case-insensitive matching
-                        const lowerUrl = url.toLowerCase();
-                        
-                        // Check if any founder name appears in the URL
-                        return names.some(name => {
-                            if (!name) return false;
-                            
-                            // Split name into parts
-                            const nameParts = name.toLowerCase().split(' ');
-                            
-                            // Check if any part of the name (at least 3 chars) is in the URL
-                            return nameParts.some(part => part.length > 2 && lowerUrl.includes(part));
-                        });
-                    }
-                    
-                    // Extract founder LinkedIn URLs (from Founders section, or near founder names)
-                    const foundersSection = document.querySelector('.Founders, [class*="founder"], [class*="Founder"]');
-                    const founderLinks = foundersSection ? 
-                        Array.from(foundersSection.querySelectorAll('a[href*="linkedin.com"]')).map(a => a.href) : [];
-                    
-                    // Extract all LinkedIn URLs from the page
-                    const allLinkedinUrls = Array.from(document.querySelectorAll('a[href*="linkedin.com"]'))
-                        .map(a => a.href)
-                        .filter(url => url && url.includes('linkedin.com'));
-                    
-                    // Categorize LinkedIn URLs
-                    let founderLinkedinUrls = founderLinks;
-                    
-                    // If no founder LinkedIn URLs found directly, try to identify them by name
-                    if (founderLinkedinUrls.length === 0 && founderNames.length > 0) {
-                        founderLinkedinUrls = allLinkedinUrls.filter(url => isFounderUrl(url, founderNames));
-                    }
-                    
-                    // Remaining URLs are likely company URLs
-                    const companyLinkedinUrls = allLinkedinUrls.filter(url => !founderLinkedinUrls.includes(url));
-                    
-                    return {
-                        title: safeExtract([
-                            'h1',
-                            '.job-title',
-                            '.JobTitle',
-                            '.role-title',
-                            'title'
-                        ]),
-                        company: safeExtract([
-                            '.company-name',
-                            '.CompanyName',
-                            '.company-title',
-                            'h2'
-                        ]),
-                        linkedin_urls: allLinkedinUrls,
-                        founder_linkedin_urls: founderLinkedinUrls,
-                        company_linkedin_urls: companyLinkedinUrls,
-                        founder_names: founderNames
-                    };
-                }
-            """)
+            # Try the lightweight HTTP path first, only rendering when needed
+            data = await self._fetch_linkedin_http(job_url)
+            if data:
+                self.logger.info(f"Extracted LinkedIn URLs for {job_url} without a browser")
+            else:
+                data = await self._render_linkedin(job_url)
             
             result = {
                 'job_url': job_url,
                 'title': data.get('title', ''),
                 'company': data.get('company', ''),
-                'linkedin_urls': data.get('linkedin_urls', []),
-                'founder_linkedin_urls': data.get('founder_linkedin_urls', []),
-                'company_linkedin_urls': data.get('company_linkedin_urls', []),
+                'linkedin_urls': [u for u in data.get('linkedin_urls', []) if validate_linkedin_url(u)],
+                'founder_linkedin_urls': [u for u in data.get('founder_linkedin_urls', []) if validate_linkedin_url(u)],
+                'company_linkedin_urls': [u for u in data.get('company_linkedin_urls', []) if validate_linkedin_url(u)],
                 'founder_names': data.get('founder_names', [])
             }
             
@@ -431,8 +791,7 @@ class YCombinatorScraper:
             return result
             
         except Exception as e:
-            self.logger.error(f"Error extracting LinkedIn URLs from {job_url}: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error extracting LinkedIn URLs from {job_url}: {str(e)}")
             return {
                 'job_url': job_url,
                 'title': '',
@@ -443,11 +802,18 @@ class YCombinatorScraper:
                 'founder_names': [],
                 'error': str(e)
             }
-        finally:
-            await page.close()
             
-    async def scrape_linkedin_urls(self, url: str) -> list:
-        """Scrape LinkedIn URLs from all job pages."""
+    async def scrape_linkedin_urls(self, url: str, max_concurrency: Optional[int] = None) -> list:
+        """
+        Scrape LinkedIn URLs from all job pages.
+        
+        Args:
+            url: Job listings page to scrape
+            max_concurrency: Job pages in flight at once, defaults to CONCURRENT_WORKERS
+            
+        Returns:
+            LinkedIn data for every job page that was processed
+        """
         results = []
         try:
             async with self.browser_context():
@@ -460,32 +826,44 @@ class YCombinatorScraper:
                     self.logger.warning("No job URLs found to scrape")
                     return []
 
-                # Extract LinkedIn URLs from each job page
-                for i, job_url in enumerate(job_urls):
-                    try:
+                # Extract LinkedIn URLs from the job pages concurrently, bounded
+                # by the same worker limit used for job details
+                semaphore = asyncio.Semaphore(max_concurrency or CONCURRENT_WORKERS)
+
+                async def _bounded(i: int, job_url: str) -> Optional[Dict[str, Any]]:
+                    async with self._host_slot(job_url), semaphore:
                         self.logger.info(f"Processing job {i+1}/{len(job_urls)}: {job_url}")
-                        data = await self.extract_linkedin_urls(job_url)
-                        
-                        # Log whether we found LinkedIn URLs
-                        linkedin_urls = data.get('linkedin_urls', [])
-                        if linkedin_urls:
-                            self.logger.info(f"Found {len(linkedin_urls)} LinkedIn URLs on {job_url}")
-                            self.logger.debug(f"LinkedIn URLs: {linkedin_urls}")
-                            results.append(data)
-                        else:
-                            self.logger.warning(f"No LinkedIn URLs found on {job_url}")
-                        
-                        # Rate limiting
-                        await asyncio.sleep(1)
-                    except Exception as e:
-                        self.logger.error(f"Error processing job {job_url}: {str(e)}")
-                        self.logger.error(f"Traceback: {traceback.format_exc()}")
+                        try:
+                            return await asyncio.wait_for(
+                                self.extract_linkedin_urls(job_url), timeout=self.config.PER_JOB_TIMEOUT
+                            )
+                        except asyncio.TimeoutError:
+                            self.logger.warning(f"Skipping {job_url}: no result within {self.config.PER_JOB_TIMEOUT}s")
+                            return None
+
+                data_list = await asyncio.gather(
+                    *(_bounded(i, job_url) for i, job_url in enumerate(job_urls)),
+                    return_exceptions=True
+                )
+                for job_url, data in zip(job_urls, data_list):
+                    if isinstance(data, Exception):
+                        self.logger.error(f"Error processing job {job_url}: {str(data)}")
                         continue
+                    if not data:
+                        continue
+                    
+                    # Log whether we found LinkedIn URLs
+                    linkedin_urls = data.get('linkedin_urls', [])
+                    if linkedin_urls:
+                        self.logger.info(f"Found {len(linkedin_urls)} LinkedIn URLs on {job_url}")
+                        self.logger.debug(f"LinkedIn URLs: {linkedin_urls}")
+                        results.append(data)
+                    else:
+                        self.logger.warning(f"No LinkedIn URLs found on {job_url}")
 
                 self.logger.info(f"Successfully extracted LinkedIn URLs from {len(results)} out of {len(job_urls)} job pages")
                 return results
 
         except Exception as e:
-            self.logger.error(f"Error in LinkedIn URL scrape process: {str(e)}")
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+            self.logger.exception(f"Error in LinkedIn URL scrape process: {str(e)}")
             return results 
\ No newline at end of file
@@ -5,156 +5,209 @@ Simple scraper to extract LinkedIn URLs from Y Combinator job pages.
 import logging
 import asyncio
 import re
-from typing import List, Dict, Any
-from playwright.async_api import async_playwright, Page, Browser, TimeoutError
+from pathlib import Path
+from typing import Iterable, List, Dict, Any, Optional
+from urllib.parse import urldefrag, urljoin
+import httpx
+from playwright.async_api import Page, BrowserContext, Route, TimeoutError
+from selectolax.lexbor import LexborHTMLParser
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('linkedin_scraper.log')
-    ]
-)
+from app.config import get_config
+from app.scraper.scraper import close_shared_browser, first_text, get_shared_browser
 
 logger = logging.getLogger(__name__)
 
-async def process_job_page(context, job_url: str) -> Dict[str, Any]:
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+# LinkedIn links as they appear in raw HTML, matched on bytes so the body
+# never has to be decoded just to be searched. A match stops at '&' so links
+# inside entity-escaped attributes (&quot;...&quot;) end at the entity; the
+# profile path always comes before any query string
+LINKEDIN_HREF_RE = re.compile(rb'https?://(?:[\w-]+\.)?linkedin\.com/[^\s"\'<>&]+', re.IGNORECASE)
+
+# A single company's job posting, e.g. /companies/acme/jobs/abc123-engineer
+COMPANY_JOB_PATH_RE = re.compile(r'/companies/[^/?#]+/jobs/')
+
+# Path segments of the LinkedIn pages worth keeping (people and companies);
+# share, jobs and feed links are dropped
+LINKEDIN_PROFILE_PATHS = ('/in/', '/company/')
+
+COMPANY_SELECTORS = ['h2', '.company-name', '.CompanyName', '.company']
+
+# Subresources never needed to read anchors and text
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# Page-side extractors, installed once per context with add_init_script so
+# each evaluate only ships a short call. Selector lists travel as the call
+# argument so the HTTP and browser paths share COMPANY_SELECTORS
+EXTRACTORS_JS = """
+window.__weaverExtractJobPage = (companySelectors) => {
+    // Get basic job info
+    const title = document.querySelector('h1')?.innerText.trim() || document.title || '';
+    let company = '';
+
+    // Try different selectors for company name (COMPANY_SELECTORS, passed in).
+    // One walk collects every candidate; selector order still decides the winner.
+    // The element checked for each selector is its first match, as before
+    const candidates = document.querySelectorAll(companySelectors.join(', '));
+    for (const selector of companySelectors) {
+        const element = Array.prototype.find.call(candidates, el => el.matches(selector));
+        if (element && element.innerText.trim()) {
+            company = element.innerText.trim();
+            break;
+        }
+    }
+
+    // Find all LinkedIn URLs. The old per-section passes (social links, founder
+    // cards, company info, icon-only links, every <a> on the page) only ever
+    // kept anchors whose href contains linkedin.com, so one href-filtered walk
+    // finds them all. Hrefs come back raw; linkedin_profile_urls filters and dedups them
+    const linkedinUrls = Array.from(document.querySelectorAll('a[href*="linkedin.com"]'), a => a.href);
+
+    return {
+        title,
+        company,
+        linkedin_urls: linkedinUrls
+    };
+};
+
+window.__weaverExtractJobLinks = () => {
+    // Only anchors pointing at a job can be processed, so let the selector
+    // engine do the /jobs/ filtering. The attribute may be relative; a.href
+    // is always resolved, and Python dedups after normalizing
+    return Array.from(document.querySelectorAll('a[href*="/jobs/"]'), a => a.href)
+        .filter(url => url.startsWith('http'));
+};
+"""
+
+async def shutdown() -> None:
+    """Close the running loop's shared browser and stop its Playwright driver."""
+    await close_shared_browser()
+    logger.info("Browser resources cleaned up")
+
+async def block_resources(route: Route) -> None:
+    """Abort requests for resource types the extractors never read."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+class PagePool:
+    """
+    Pages on one browser context, handed from job to job.
+    
+    Navigating an open page is far cheaper than creating one, so pages are
+    opened on demand up to size and then reused by the next job.
+    """
+    
+    def __init__(self, context: BrowserContext, size: int):
+        """
+        Initialize the pool.
+        
+        Args:
+            context: Context the pages belong to
+            size: Most pages ever open at once
+        """
+        self.context = context
+        self.size = size
+        # Idle pages; None stands for a slot whose page was closed
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+    
+    async def get(self) -> Page:
+        """Take an idle page, opening one while the pool is under size."""
+        if self._idle.empty() and self._created < self.size:
+            self._created += 1
+            page = None
+        else:
+            page = await self._idle.get()
+        
+        if page is None:
+            try:
+                page = await self.context.new_page()
+            except Exception:
+                self._idle.put_nowait(None)
+                raise
+        return page
+    
+    def put(self, page: Page) -> None:
+        """Return a page for the next job; a closed page gives its slot back."""
+        self._idle.put_nowait(None if page.is_closed() else page)
+
+def linkedin_profile_urls(hrefs: Iterable[str]) -> List[str]:
+    """
+    Keep the LinkedIn links that point at a person or a company.
+    
+    Args:
+        hrefs: Candidate LinkedIn hrefs, possibly repeated
+        
+    Returns:
+        Profile and company page URLs, deduped in discovery order
+    """
+    return list(dict.fromkeys(
+        href for href in hrefs
+        if 'linkedin.com/' in href and any(path in href for path in LINKEDIN_PROFILE_PATHS)
+    ))
+
+async def fetch_job_page_http(client: httpx.AsyncClient, job_url: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract LinkedIn URLs from a job page's raw HTML without a browser.
+    
+    Args:
+        client: Shared HTTP client
+        job_url: Job page to fetch
+        
+    Returns:
+        Job data, or None if the HTML has no LinkedIn links and needs a render
+    """
+    try:
+        response = await client.get(job_url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.debug(f"HTTP fetch failed for {job_url}: {str(e)}")
+        return None
+    
+    linkedin_urls = linkedin_profile_urls(
+        match.group(0).decode('utf-8', 'replace')
+        for match in LINKEDIN_HREF_RE.finditer(response.content)
+    )
+    if not linkedin_urls:
+        return None
+    
+    tree = LexborHTMLParser(response.text)
+    return {
+        'job_url': job_url,
+        'title': first_text(tree, ['h1', 'title']),
+        'company': first_text(tree, COMPANY_SELECTORS),
+        'linkedin_urls': linkedin_urls
+    }
+
+async def process_job_page(pages: PagePool, job_url: str, client: Optional[httpx.AsyncClient] = None) -> Dict[str, Any]:
     """Process a single job page and extract LinkedIn URLs."""
-    job_page = await context.new_page()
+    # Try the raw HTML first, only rendering when it has no LinkedIn links
+    if client:
+        job_data = await fetch_job_page_http(client, job_url)
+        if job_data:
+            logger.info(f"Extracted LinkedIn URLs from {job_url} without a browser")
+            return job_data
+    
+    job_page = await pages.get()
     try:
         await job_page.goto(job_url, wait_until='domcontentloaded', timeout=30000)
         
+        # Wait for the founders block or any LinkedIn link rather than for the
+        # network to go quiet, which analytics traffic rarely lets happen
         try:
-            await job_page.wait_for_load_state('networkidle', timeout=15000)
+            await job_page.wait_for_selector(
+                '.Founders, [class*="founder"], a[href*="linkedin.com"]', state='attached', timeout=8000
+            )
         except TimeoutError:
-            logger.warning(f"Network idle timeout reached for {job_url}, continuing anyway")
-        
-        # Wait longer for JavaScript to execute and ensure all elements are loaded
-        await asyncio.sleep(5)
+            logger.warning(f"No founders section appeared on {job_url}, extracting anyway")
         
         # Extract job details and LinkedIn URLs
-        job_data = await job_page.evaluate("""
-            () => {
-                // Get basic job info
-                const title = document.querySelector('h1')?.innerText.trim() || document.title || '';
-                let company = '';
-                
-                // Try different selectors for company name
-                const companySelectors = ['h2', '.company-name', '.CompanyName', '.company'];
-                for (const selector of companySelectors) {
-                    const element = document.querySelector(selector);
-                    if (element && element.innerText.trim()) {
-                        company = element.innerText.trim();
-                        break;
-                    }
-                }
-                
-                // Find all LinkedIn URLs with a more comprehensive approach
-                const linkedinUrls = [];
-                
-                // Method 1: Direct link detection
-                document.querySelectorAll('a[href*="linkedin.com"]').forEach(a => {
-                    if (a.href && a.href.includes('linkedin.com')) {
-                        linkedinUrls.push(a.href);
-                    }
-                });
-                
-                // Method 2: Look for social links that might contain LinkedIn
-                document.querySelectorAll('a.social-link, a.linkedin, a[aria-label*="LinkedIn"], a[title*="LinkedIn"]').forEach(a => {
-                    if (a.href && a.href.includes('linkedin.com')) {
-                        linkedinUrls.push(a.href);
-                    }
-                });
-                
-                // Method 3: Look for social icons
-                document.querySelectorAll('a i.fa-linkedin, a i.linkedin, a svg[class*="linkedin"], a svg[class*="Linkedin"]').forEach(icon => {
-                    const link = icon.closest('a');
-                    if (link && link.href && link.href.includes('linkedin.com')) {
-                        linkedinUrls.push(link.href);
-                    }
-                });
-                
-                // Method 4: Look for Founder section LinkedIn links (new)
-                document.querySelectorAll('.Founders a, [class*="founder"] a').forEach(a => {
-                    if (a.href && a.href.includes('linkedin.com')) {
-                        linkedinUrls.push(a.href);
-                    }
-                });
-                
-                // Method 4b: Try to find founder cards and extract LinkedIn URLs
-                const founderElements = document.querySelectorAll('.Founders > div, [id*="founder"], [class*="Founder"]');
-                founderElements.forEach(founderEl => {
-                    const links = founderEl.querySelectorAll('a');
-                    links.forEach(link => {
-                        if (link.href && link.href.includes('linkedin.com')) {
-                            linkedinUrls.push(link.href);
-                        }
-                    });
-                });
-                
-                // Method 5: Look for any SVG inside links that might be LinkedIn icons
-                document.querySelectorAll('a svg').forEach(svg => {
-                    const link = svg.closest('a');
-                    if (link && link.href && link.href.includes('linkedin.com')) {
-                        linkedinUrls.push(link.href);
-                    }
-                });
-
-                // Method 6: Look specifically for LinkedIn icons by examining all links
-                document.querySelectorAll('a').forEach(a => {
-                    // Check if link contains an image that might be a LinkedIn icon
-                    const hasLinkedInIcon = 
-                        a.querySelector('img[src*="linkedin"], img[alt*="LinkedIn"], svg[class*="linkedin"]') !== null ||
-                        (a.innerHTML.includes('in') && a.classList.length > 0 && a.textContent.trim().length <= 2);
-                    
-                    if (hasLinkedInIcon && a.href && a.href.includes('linkedin.com')) {
-                        linkedinUrls.push(a.href);
-                    } else if (a.href && a.href.includes('linkedin.com')) {
-                        linkedinUrls.push(a.href);
-                    }
-                });
-                
-                // Method 7: Target the social icons section specifically
-                const socialIconsSection = document.querySelectorAll('.social-icons, [class*="social"], [class*="Social"]');
-                socialIconsSection.forEach(section => {
-                    const links = section.querySelectorAll('a');
-                    links.forEach(link => {
-                        if (link.href && link.href.includes('linkedin.com')) {
-                            linkedinUrls.push(link.href);
-                        }
-                    });
-                });
-                
-                // Method 8: Look for any links near the company info section
-                const companyInfo = document.querySelector('[class*="company-info"], .CompanyInfo, .company');
-                if (companyInfo) {
-                    const links = companyInfo.querySelectorAll('a');
-                    links.forEach(link => {
-                        if (link.href && link.href.includes('linkedin.com')) {
-                            linkedinUrls.push(link.href);
-                        }
-                    });
-                }
-                
-                // Debug info - output all link elements with their href
-                console.log('All links on page:');
-                const allLinks = Array.from(document.querySelectorAll('a')).map(a => ({
-                    href: a.href,
-                    text: a.textContent.trim(),
-                    hasChildren: a.children.length > 0,
-                    classes: a.className
-                }));
-                console.log(JSON.stringify(allLinks));
-                
-                return {
-                    title,
-                    company,
-                    linkedin_urls: [...new Set(linkedinUrls)] // Remove duplicates
-                };
-            }
-        """)
+        job_data = await job_page.evaluate("(selectors) => window.__weaverExtractJobPage(selectors)", COMPANY_SELECTORS)
+        
+        job_data['linkedin_urls'] = linkedin_profile_urls(job_data['linkedin_urls'])
         
         # Add job URL to the data
         job_data['job_url'] = job_url
@@ -164,20 +217,21 @@ async def process_job_page(context, job_url: str) -> Dict[str, Any]:
     except Exception as e:
         logger.error(f"Error processing job page {job_url}: {str(e)}")
         
-        # Try to capture debug info for troubleshooting
-        try:
-            # Capture a screenshot
-            screenshot_path = f"debug_screenshot_{job_url.split('/')[-1]}.png"
-            await job_page.screenshot(path=screenshot_path)
-            logger.info(f"Captured debug screenshot to {screenshot_path}")
-            
-            # Capture HTML structure
-            html_content = await job_page.content()
-            with open(f"debug_html_{job_url.split('/')[-1]}.html", "w", encoding="utf-8") as f:
-                f.write(html_content)
-            logger.info(f"Captured HTML content to debug_html_{job_url.split('/')[-1]}.html")
-        except Exception as debug_err:
-            logger.error(f"Error capturing debug info: {str(debug_err)}")
+        # Capture debug info for troubleshooting when asked to (SCRAPER_DEBUG=1);
+        # files are written off the event loop so other jobs keep running
+        if get_config().SCRAPER_DEBUG:
+            try:
+                # Capture a screenshot
+                screenshot_path = Path(f"debug_screenshot_{job_url.split('/')[-1]}.png")
+                await asyncio.to_thread(screenshot_path.write_bytes, await job_page.screenshot())
+                logger.info(f"Captured debug screenshot to {screenshot_path}")
+                
+                # Capture HTML structure
+                html_path = Path(f"debug_html_{job_url.split('/')[-1]}.html")
+                await asyncio.to_thread(html_path.write_text, await job_page.content(), encoding="utf-8")
+                logger.info(f"Captured HTML content to {html_path}")
+            except Exception as debug_err:
+                logger.error(f"Error capturing debug info: {str(debug_err)}")
         
         return {
             'job_url': job_url,
@@ -187,43 +241,44 @@ async def process_job_page(context, job_url: str) -> Dict[str, Any]:
             'error': str(e)
         }
     finally:
-        await job_page.close()
+        pages.put(job_page)
 
 async def extract_linkedin_urls(url: str) -> List[Dict[str, Any]]:
     """Extract LinkedIn URLs from Y Combinator job pages."""
     results = []
-    playwright = None
-    browser = None
+    context = None
+    client = None
     
     try:
         logger.info(f"Starting LinkedIn URL extraction for {url}")
         
         # Check if this is already a direct job page URL
-        is_direct_job_page = '/companies/' in url and '/jobs/' in url
+        is_direct_job_page = COMPANY_JOB_PATH_RE.search(url) is not None
         if is_direct_job_page:
             logger.info(f"Direct job page URL detected: {url}")
         
-        # Initialize Playwright and browser
-        playwright = await async_playwright().start()
-        browser = await playwright.chromium.launch(
-            headless=True,
-            args=[
-                '--no-sandbox',
-                '--disable-dev-shm-usage',
-                '--disable-gpu'
-            ]
-        )
+        browser = await get_shared_browser()
         
         # Create a context
         context = await browser.new_context(
             viewport={'width': 1920, 'height': 1080},
-            user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            user_agent=USER_AGENT
+        )
+        await context.route("**/*", block_resources)
+        await context.add_init_script(EXTRACTORS_JS)
+        concurrency = get_config().CONCURRENT_WORKERS or 5
+        pages = PagePool(context, concurrency)
+        client = httpx.AsyncClient(
+            http2=True,
+            headers={'User-Agent': USER_AGENT},
+            timeout=10,
+            follow_redirects=True
         )
         
         # If this is a direct job page URL, process it directly
         if is_direct_job_page:
             logger.info(f"Processing direct job page URL: {url}")
-            job_data = await process_job_page(context, url)
+            job_data = await process_job_page(pages, url, client)
             linkedin_urls = job_data.get('linkedin_urls', [])
             
             if linkedin_urls and len(linkedin_urls) > 0:
@@ -236,127 +291,44 @@ async def extract_linkedin_urls(url: str) -> List[Dict[str, Any]]:
             return results
         
         # Otherwise, process as a job listing page
-        # Create a page and navigate to the job listings
-        page = await context.new_page()
+        # Take a page from the pool and navigate to the job listings; it goes
+        # back to the pool for the job pages once the links are read
+        page = await pages.get()
         logger.info(f"Navigating to {url}")
         await page.goto(url, wait_until='domcontentloaded', timeout=30000)
         
+        # Wait for company job links to render rather than a fixed delay; they
+        # are the only content the extractor reads, so they are the one signal
         try:
-            await page.wait_for_load_state('networkidle', timeout=15000)
+            await page.wait_for_selector('a[href*="/companies/"]', state='attached', timeout=5000)
         except TimeoutError:
-            logger.warning("Network idle timeout reached, continuing anyway")
-        
-        # Wait for some content to load
-        try:
-            # Try to wait for common content selectors
-            selectors_to_try = ['main', 'body', 'article', '.job-listing', '.Founders']
-            selector_found = False
-            for selector in selectors_to_try:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    logger.info(f"Found content with selector: {selector}")
-                    selector_found = True
-                    break
-                except TimeoutError:
-                    continue
-                
-            if selector_found:
-                logger.info("Basic page content loaded")
-            else:
-                logger.warning("No expected content selectors found, but continuing anyway")
-        except Exception as e:
-            logger.warning(f"Error waiting for selectors, but proceeding anyway: {str(e)}")
-        
-        # Wait a moment for JavaScript to execute
-        await asyncio.sleep(2)
+            logger.warning("No company links appeared, extracting anyway")
         
         # Extract job URLs with a more robust approach
         logger.info("Extracting job URLs")
-        job_urls = await page.evaluate("""
-            () => {
-                // Debug helper to log found elements
-                function logFoundElements(selector, count) {
-                    console.log(`Found ${count} elements with selector: ${selector}`);
-                }
-                
-                // Get all links that might be job listings
-                let allJobUrls = [];
-                
-                // Try different selectors that might contain job links
-                const selectors = [
-                    'a[href*="/companies/"][href*="/jobs/"]',
-                    '.job-listing a',
-                    '.JobListing a',
-                    'article a[href*="/jobs/"]',
-                    'a[href*="/jobs/"]',
-                    // Add more specific selectors based on the Y Combinator job page structure
-                    '[role="job"] a',
-                    '[role="listitem"] a',
-                    'main a',
-                    // Selector for job cards as seen in the screenshot
-                    'article a',
-                    // Add new selectors for the recruiting-hr job page format
-                    'ul li a[href*="/companies/"]',
-                    'li a[href*="/jobs/"]',
-                    '.jobs-list li a',
-                    // Add a more general selector as a fallback
-                    'a'
-                ];
-                
-                // Instead of returning on first match, collect all potential job URLs from all selectors
-                for (const selector of selectors) {
-                    const elements = document.querySelectorAll(selector);
-                    if (elements.length > 0) {
-                        // Filter for job URLs
-                        const urls = Array.from(elements)
-                            .map(el => el.href)
-                            .filter(url => url && 
-                                (url.includes('/jobs/') || 
-                                 url.includes('/companies/') || 
-                                 url.includes('ycombinator')));
-                        
-                        if (urls.length > 0) {
-                            logFoundElements(selector, urls.length);
-                            allJobUrls = [...allJobUrls, ...urls];
-                        }
-                    }
-                }
-                
-                // If we found any job URLs through selectors, return them
-                if (allJobUrls.length > 0) {
-                    // Remove duplicates
-                    return [...new Set(allJobUrls)];
-                }
-                
-                // Fallback: try to find any links that look like job URLs
-                console.log("Using fallback method to find job URLs");
-                return Array.from(document.querySelectorAll('a'))
-                    .map(a => a.href)
-                    .filter(url => url && url.includes('/jobs/'));
-            }
-        """)
+        job_urls = await page.evaluate("() => window.__weaverExtractJobLinks()")
+        
+        # Resolve against the page we actually landed on (after redirects) and
+        # drop fragments so variants of the same job collapse to one URL
+        base_url = page.url
+        pages.put(page)
+        job_urls = list(dict.fromkeys(urldefrag(urljoin(base_url, job_url)).url for job_url in job_urls))
         
         # Log the found URLs for debugging
         logger.info(f"Raw job URLs found: {len(job_urls)}")
-        for i, url in enumerate(job_urls[:5]):
-            logger.info(f"Sample URL {i+1}: {url}")
+        for i, sample_url in enumerate(job_urls[:5]):
+            logger.info(f"Sample URL {i+1}: {sample_url}")
         
         if not job_urls or len(job_urls) == 0:
             logger.warning("No job URLs found")
             return []
             
-        # Filter for likely job URLs
-        filtered_urls = [url for url in job_urls if '/jobs/' in url and url.startswith('http')]
-        if filtered_urls:
-            job_urls = filtered_urls
-        
         # Prioritize actual company job URLs over navigation URLs
-        company_job_urls = [url for url in job_urls if '/companies/' in url and '/jobs/' in url]
+        company_job_urls = [url for url in job_urls if COMPANY_JOB_PATH_RE.search(url)]
         if company_job_urls:
             logger.info(f"Found {len(company_job_urls)} company job URLs, prioritizing these")
             job_urls = company_job_urls
         
-        job_urls = list(set(job_urls))  # Remove duplicates
         logger.info(f"Found {len(job_urls)} job URLs")
         
         # Process each job URL (limit to 5 for testing)
@@ -372,28 +344,34 @@ async def extract_linkedin_urls(url: str) -> List[Dict[str, Any]]:
             logger.info("Role-specific page detected - processing more URLs")
             max_to_process = min(len(job_urls), 15)  # Process more URLs from role pages
                 
-        for i, job_url in enumerate(job_urls[:max_to_process]):
-            try:
+        # Process the job pages concurrently on the shared context; the
+        # semaphore bounds how many are in flight and doubles as the rate limit,
+        # and matches the pool size so every job finds a page
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def _bounded(i: int, job_url: str) -> Dict[str, Any]:
+            async with semaphore:
                 logger.info(f"Processing job {i+1}/{max_to_process}: {job_url}")
-                
-                # Process the job page using our helper function
-                job_data = await process_job_page(context, job_url)
-                
-                # Log results
-                linkedin_urls = job_data.get('linkedin_urls', [])
-                if linkedin_urls and len(linkedin_urls) > 0:
-                    logger.info(f"Found {len(linkedin_urls)} LinkedIn URLs on {job_url}")
-                    logger.info(f"LinkedIn URLs: {linkedin_urls}")
-                    results.append(job_data)
-                else:
-                    logger.warning(f"No LinkedIn URLs found on {job_url}")
-                
-                # Rate limiting
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Error processing job {job_url}: {str(e)}")
+                return await process_job_page(pages, job_url, client)
+        
+        batch = job_urls[:max_to_process]
+        job_data_list = await asyncio.gather(
+            *(_bounded(i, job_url) for i, job_url in enumerate(batch)),
+            return_exceptions=True
+        )
+        for job_url, job_data in zip(batch, job_data_list):
+            if isinstance(job_data, Exception):
+                logger.error(f"Error processing job {job_url}: {str(job_data)}")
                 continue
+            
+            # Log results
+            linkedin_urls = job_data.get('linkedin_urls', [])
+            if linkedin_urls:
+                logger.info(f"Found {len(linkedin_urls)} LinkedIn URLs on {job_url}")
+                logger.info(f"LinkedIn URLs: {linkedin_urls}")
+                results.append(job_data)
+            else:
+                logger.warning(f"No LinkedIn URLs found on {job_url}")
         
         logger.info(f"Successfully extracted LinkedIn URLs from {len(results)} job pages")
         return results
@@ -403,20 +381,24 @@ async def extract_linkedin_urls(url: str) -> List[Dict[str, Any]]:
         return results
         
     finally:
-        if browser:
-            await browser.close()
-        if playwright:
-            await playwright.stop()
-        logger.info("Browser resources cleaned up")
+        if client:
+            await client.aclose()
+        if context:
+            await context.close()
 
 async def main(url: str):
     """Main function to run the scraper."""
-    results = await extract_linkedin_urls(url)
+    try:
+        results = await extract_linkedin_urls(url)
+    finally:
+        await shutdown()
     return results
 
 if __name__ == "__main__":
     import sys
     
+    get_config().setup_logging('linkedin_scraper.log')
+    
     if len(sys.argv) > 1:
         url = sys.argv[1]
     else:
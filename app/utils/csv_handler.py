@@ -13,10 +13,22 @@ from app.config import get_config
 logger = logging.getLogger(__name__)
 config = get_config()
 
+# Writer settings are fixed for the life of the process
+FIELDNAMES = tuple(config.CSV_HEADERS)
+DELIMITER = config.CSV_DELIMITER
+QUOTECHAR = config.CSV_QUOTECHAR
+
+def _row_values(row: Dict[str, str]) -> tuple:
+    """Values of a job row in FIELDNAMES order, blank where a field is missing."""
+    return tuple(row.get(field, '') for field in FIELDNAMES)
+
 def get_csv_as_string(data: List[Dict[str, str]]) -> Optional[str]:
     """
     Generate CSV content as a string from job data.
     
+    Columns follow FIELDNAMES: missing fields are written blank and keys
+    outside FIELDNAMES are ignored.
+    
     Args:
         data: List of job dictionaries to convert to CSV
         
@@ -28,20 +40,13 @@ def get_csv_as_string(data: List[Dict[str, str]]) -> Optional[str]:
     
     try:
         output = StringIO()
-        fieldnames = config.CSV_HEADERS
-        writer = csv.DictWriter(
-            output,
-            fieldnames=fieldnames,
-            delimiter=config.CSV_DELIMITER,
-            quotechar=config.CSV_QUOTECHAR
-        )
+        writer = csv.writer(output, delimiter=DELIMITER, quotechar=QUOTECHAR)
         
         # Write header
-        writer.writeheader()
+        writer.writerow(FIELDNAMES)
         
         # Write data rows
-        for row in data:
-            writer.writerow(row)
+        writer.writerows(map(_row_values, data))
         
         return output.getvalue()
         
@@ -0,0 +1,37 @@
+"""
+JSON provider backed by orjson.
+"""
+
+from typing import Any, Union
+
+import orjson
+from flask.json.provider import JSONProvider
+
+class OrjsonProvider(JSONProvider):
+    """Serializes responses and parses request bodies with orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+        
+        Args:
+            obj: The data to serialize; datetimes, dataclasses and UUIDs are handled natively
+            kwargs: Accepted for API compatibility, ignored
+            
+        Returns:
+            str: The JSON document
+        """
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """
+        Deserialize data from JSON.
+        
+        Args:
+            s: Text or UTF-8 bytes
+            kwargs: Accepted for API compatibility, ignored
+            
+        Returns:
+            The decoded data
+        """
+        return orjson.loads(s)
@@ -3,19 +3,49 @@ Retry handler utility with exponential backoff.
 """
 
 import time
+import random
+import asyncio
 import logging
 from functools import wraps
-from typing import Callable, TypeVar, Any
+from typing import Callable, Tuple, TypeVar, Any
 from app.config import Config
 
 T = TypeVar('T')
 
 logger = logging.getLogger(__name__)
 
+def _backoff_schedule() -> Tuple[float, ...]:
+    """
+    Compute the base delay before each retry.
+    
+    Returns:
+        Exponential backoff per attempt, capped at Config.RETRY_MAX_DELAY
+    """
+    return tuple(
+        min(Config.RETRY_MAX_DELAY, Config.RETRY_DELAY * (1 << attempt))
+        for attempt in range(Config.MAX_RETRIES)
+    )
+
+def jittered(delay: float) -> float:
+    """
+    Spread a scheduled delay so callers failing together retry apart.
+    
+    Args:
+        delay: Scheduled delay in seconds
+        
+    Returns:
+        The delay scaled by a random factor in [0.5, 1.5), still capped at
+        Config.RETRY_MAX_DELAY
+    """
+    return min(Config.RETRY_MAX_DELAY, delay * (0.5 + random.random()))
+
 def with_retry(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator that implements retry logic with exponential backoff.
     
+    Coroutine functions get an async wrapper that backs off with
+    asyncio.sleep, so a retrying task never blocks the event loop.
+    
     Args:
         func: The function to be decorated
         
@@ -25,6 +55,37 @@ def with_retry(func: Callable[..., T]) -> Callable[..., T]:
     Raises:
         The last exception encountered after all retries are exhausted
     """
+    # The schedule only depends on configuration, so build it once per function
+    schedule = _backoff_schedule()
+    
+    if asyncio.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+            last_exception = None
+            
+            for attempt in range(Config.MAX_RETRIES):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    last_exception = e
+                    if attempt < Config.MAX_RETRIES - 1:  # Don't sleep on the last attempt
+                        delay = jittered(schedule[attempt])
+                        logger.warning(
+                            f"Attempt {attempt + 1} failed. Retrying in {delay:.2f} seconds. "
+                            f"Error: {str(e)}"
+                        )
+                        await asyncio.sleep(delay)
+                    else:
+                        logger.error(
+                            f"All {Config.MAX_RETRIES} attempts failed. "
+                            f"Final error: {str(e)}"
+                        )
+            
+            if last_exception:
+                raise last_exception
+                
+        return async_wrapper
+    
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
         last_exception = None
@@ -35,9 +96,9 @@ def with_retry(func: Callable[..., T]) -> Callable[..., T]:
             except Exception as e:
                 last_exception = e
                 if attempt < Config.MAX_RETRIES - 1:  # Don't sleep on the last attempt
-                    delay = Config.RETRY_DELAY * (2 ** attempt)  # Exponential backoff
+                    delay = jittered(schedule[attempt])
                     logger.warning(
-                        f"Attempt {attempt + 1} failed. Retrying in {delay} seconds. "
+                        f"Attempt {attempt + 1} failed. Retrying in {delay:.2f} seconds. "
                         f"Error: {str(e)}"
                     )
                     time.sleep(delay)
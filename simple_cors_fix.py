@@ -2,20 +2,65 @@
 CORS proxy server for Weaver Backend.
 """
 
-from flask import Flask, request, jsonify, Response, make_response
+# Patch sockets before requests/flask are imported so that waiting on the
+# backend yields to other requests instead of blocking a worker. Gunicorn's
+# gevent worker patches before loading the app, so this is only needed when
+# the file is run directly; importing it (tests, tooling) patches nothing
+from gevent import monkey
+if __name__ == '__main__':
+    monkey.patch_all()
+
+from flask import Flask, request, Response, stream_with_context
+from gevent import get_hub
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import atexit
 import logging
+import logging.handlers
 import os
+import threading
+import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG, 
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('cors_proxy.log')
-    ]
-)
+class ThreadpoolQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener whose monitor loop runs on a native thread.
+    
+    After monkey.patch_all(), threading.Thread starts a greenlet, so the stock
+    listener would still do its blocking writes on the hub. The monitor runs in
+    gevent's threadpool instead, reading from the unpatched SimpleQueue.
+    """
+    
+    def start(self):
+        self._thread = get_hub().threadpool.spawn(self._monitor)
+    
+    def stop(self):
+        if self._thread:
+            self.enqueue_sentinel()
+            self._thread.get()
+            self._thread = None
+
+def setup_logging():
+    """
+    Configure logging for a serving process.
+    
+    Request handlers only enqueue records; a background listener formats them
+    and does the console and file writes.
+    """
+    log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    log_handlers = [logging.StreamHandler(), logging.FileHandler('cors_proxy.log')]
+    for log_handler in log_handlers:
+        log_handler.setFormatter(log_formatter)
+    
+    log_queue = monkey.get_original('queue', 'SimpleQueue')()
+    log_listener = ThreadpoolQueueListener(log_queue, *log_handlers)
+    log_listener.start()
+    atexit.register(log_listener.stop)  # Flush queued records on shutdown
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
 logger = logging.getLogger(__name__)
 
@@ -24,86 +69,192 @@ app = Flask(__name__)
 
 # Render backend URL
 BACKEND_URL = "https://weaver-backend.onrender.com"
+HEALTH_URL = f"{BACKEND_URL}/health"
+LINKEDIN_URL = f"{BACKEND_URL}/api/scrape/linkedin"
+
+# One session for every backend call so connections (and their TLS
+# handshakes) are kept alive and reused instead of opened per request.
+# Render answers 502/503 while a service wakes from sleep, so those are
+# retried for the scrape POST too; the last response is relayed as-is.
+# Read errors and 504s are never retried: the backend may already have run
+# the scrape, and replaying the POST would start it a second time
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=2,
+        connect=2,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=[502, 503],
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False
+    )
+))
+
+# (connect, read) timeouts: a dead backend is detected in seconds, while a
+# slow scrape still gets its full two minutes
+HEALTH_TIMEOUT = (5, 10)
+SCRAPE_TIMEOUT = (5, 120)
+SESSION.headers.update({
+    'Content-Type': 'application/json',
+    'Accept': 'application/json'
+})
+
+# Backend response headers passed through to the client along with the body
+RELAYED_HEADERS = ('Content-Encoding', 'Content-Length', 'Vary', 'ETag')
+
+# CORS headers, built once and attached to every cross-origin response
+CORS_HEADERS = (
+    ('Access-Control-Allow-Origin', '*'),
+    ('Access-Control-Allow-Methods', 'GET, POST, OPTIONS'),
+    ('Access-Control-Allow-Headers', 'Content-Type, Authorization, X-Requested-With, Accept, Origin')
+)
+
+# Extra headers for preflight responses; Max-Age lets the browser cache the
+# answer for a day instead of sending a preflight before every request
+PREFLIGHT_HEADERS = (('Access-Control-Max-Age', '86400'),)
 
-# Add CORS headers to all responses
+# Add CORS headers to cross-origin responses; requests without an Origin
+# (health checks, same-origin calls) have no use for them. Every response
+# varies on Origin so a shared cache never serves a header-less copy to a
+# browser
 @app.after_request
 def add_cors_headers(response):
-    response.headers['Access-Control-Allow-Origin'] = '*'
-    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
-    response.headers['Access-Control-Allow-Headers'] = 'Content-Type, Authorization, X-Requested-With, Accept, Origin'
+    response.vary.add('Origin')
+    if request.headers.get('Origin'):
+        response.headers.extend(CORS_HEADERS)
+        if request.method == 'OPTIONS':
+            response.headers.extend(PREFLIGHT_HEADERS)
     return response
 
 # Handle OPTIONS requests explicitly
 @app.route('/', defaults={'path': ''}, methods=['OPTIONS'])
 @app.route('/<path:path>', methods=['OPTIONS'])
 def handle_options(path):
-    response = make_response()
-    return response
+    # add_cors_headers supplies the CORS and preflight headers
+    return Response(status=204)
+
+def json_response(obj, status=200):
+    """Serialize obj with orjson into a JSON response."""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
 
 # Index route for root path
 @app.route('/')
 def index():
-    return jsonify({
+    return json_response({
         'status': 'ok',
         'message': 'CORS Proxy running'
     })
 
-# Health check endpoint
-@app.route('/health')
-def health_check():
+def check_backend_health():
+    """Ask the backend for its health; returns (payload, status)."""
     try:
         # Forward health check to backend
-        backend_response = requests.get(f"{BACKEND_URL}/health", timeout=10)
-        return jsonify({
+        backend_response = SESSION.get(HEALTH_URL, timeout=HEALTH_TIMEOUT)
+        return {
             'status': 'healthy',
             'proxy': True,
             'backend_status': backend_response.status_code
-        })
+        }, 200
     except Exception as e:
         logger.error(f"Error checking backend health: {str(e)}")
-        return jsonify({
+        return {
             'status': 'unhealthy',
             'proxy': True,
             'error': str(e)
-        }), 500
+        }, 500
+
+# Last backend health result, shared by every /health call for HEALTH_CACHE_TTL
+# seconds. The lock lets one caller refresh it while the rest wait and reuse
+# the fresh result, so a burst of checks costs one backend call
+HEALTH_CACHE_TTL = 5.0
+health_cache = {'checked_at': float('-inf'), 'result': (b'', 500)}
+health_lock = threading.Lock()
+
+# Health check endpoint
+@app.route('/health')
+def health_check():
+    if time.monotonic() - health_cache['checked_at'] >= HEALTH_CACHE_TTL:
+        with health_lock:
+            # Another caller may have refreshed it while this one waited
+            if time.monotonic() - health_cache['checked_at'] >= HEALTH_CACHE_TTL:
+                payload, status = check_backend_health()
+                health_cache['result'] = (orjson.dumps(payload), status)
+                health_cache['checked_at'] = time.monotonic()
+    body, status = health_cache['result']
+    return Response(body, status=status, mimetype='application/json')
 
 # Proxy for LinkedIn scraping endpoint
 @app.route('/api/scrape/linkedin', methods=['POST'])
 def scrape_linkedin():
+    # Get request data; it is parsed only to check and log the URL and is
+    # forwarded as the original bytes
+    body = request.get_data(cache=False)
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        data = None
+    
+    # Reject bodies without a URL here rather than spending a backend scrape on them
+    if not isinstance(data, dict) or not data.get('url'):
+        logger.warning("Rejected scrape request without a URL")
+        return json_response({
+            'status': 'error',
+            'message': 'Request body must be JSON with a "url" field',
+            'data': [],
+            'progress': {
+                'status': 'error',
+                'message': 'missing url',
+                'processed': 0,
+                'total': 0
+            }
+        }, status=400)
+    
     try:
-        # Get request data
-        data = request.json
-        logger.info(f"Received scrape request for URL: {data.get('url', 'None')}")
+        logger.info(f"Received scrape request for URL: {data['url']}")
         
         # Forward request to backend
-        backend_url = f"{BACKEND_URL}/api/scrape/linkedin"
-        logger.info(f"Forwarding to backend URL: {backend_url}")
+        logger.info(f"Forwarding to backend URL: {LINKEDIN_URL}")
         
-        headers = {
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        }
-        
-        backend_response = requests.post(
-            backend_url,
-            json=data,
-            headers=headers,
-            timeout=120  # 2-minute timeout
+        # Ask for whatever encodings the client accepts so a compressed
+        # body can be relayed without being decoded here
+        backend_response = SESSION.post(
+            LINKEDIN_URL,
+            data=body,
+            headers={'Accept-Encoding': request.headers.get('Accept-Encoding', 'identity')},
+            timeout=SCRAPE_TIMEOUT,
+            stream=True
         )
         
         # Log backend response
         logger.info(f"Backend response status: {backend_response.status_code}")
         
-        # Return backend response with CORS headers
+        def relay():
+            # Pass the raw (still encoded) body through as it arrives; closing
+            # hands the connection back to the pool even if the client disconnects
+            try:
+                yield from backend_response.raw.stream(64 * 1024, decode_content=False)
+            finally:
+                backend_response.close()
+        
+        # Return backend response with CORS headers; the body is untouched,
+        # so its encoding and length headers still describe it
         return Response(
-            backend_response.content,
+            stream_with_context(relay()),
             status=backend_response.status_code,
-            content_type=backend_response.headers.get('Content-Type', 'application/json')
+            content_type=backend_response.headers.get('Content-Type', 'application/json'),
+            headers={
+                name: backend_response.headers[name]
+                for name in RELAYED_HEADERS
+                if name in backend_response.headers
+            }
         )
         
     except Exception as e:
         logger.error(f"Error proxying request: {str(e)}")
-        return jsonify({
+        return json_response({
             'status': 'error',
             'message': f'Proxy error: {str(e)}',
             'data': [],
@@ -113,8 +264,21 @@ def scrape_linkedin():
                 'processed': 0,
                 'total': 0
             }
-        }), 500
+        }, status=500)
+
+def create_app():
+    """
+    Set up process-wide logging and return the proxy app.
+    
+    Entry point for gunicorn (app:create_app()), called once per worker.
+    """
+    setup_logging()
+    return app
 
 if __name__ == '__main__':
+    from gevent.pywsgi import WSGIServer
+    
+    setup_logging()
     port = int(os.environ.get('PORT', 8000))
-    app.run(host='0.0.0.0', port=port, debug=False) 
\ No newline at end of file
+    logger.info(f"Starting CORS proxy on port {port}")
+    WSGIServer(('0.0.0.0', port), app).serve_forever() 
\ No newline at end of file
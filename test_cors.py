@@ -1,5 +1,4 @@
-import requests
-import json
+from tests._http import SESSION, decode_json, print_json
 
 # Test the CORS debug endpoint
 url = "https://weaver-backend.onrender.com/api/cors-test"
@@ -12,13 +11,13 @@ headers = {
 
 print(f"Making request to {url}...")
 print(f"With headers: {headers}")
-response = requests.get(url, headers=headers)
+response = SESSION.get(url, headers=headers)
 print(f"Status code: {response.status_code}")
 print(f"Response headers: {response.headers}")
 
 try:
-    response_data = response.json()
-    print(f"Response data: {json.dumps(response_data, indent=2)}")
+    response_data = decode_json(response)
+    print_json("Response data", response_data)
     
     # Check for CORS headers specifically
     cors_headers = [
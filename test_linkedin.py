@@ -1,5 +1,4 @@
-import requests
-import json
+from tests._http import SESSION, decode_json, print_json
 
 # Test the LinkedIn URL extraction endpoint
 url = "http://localhost:5000/api/scrape/linkedin"
@@ -7,14 +6,14 @@ headers = {"Content-Type": "application/json"}
 data = {"url": "https://www.ycombinator.com/jobs/role/sales-manager"}
 
 print(f"Making request to {url}...")
-response = requests.post(url, headers=headers, json=data)
+response = SESSION.post(url, headers=headers, json=data)
 print(f"Status code: {response.status_code}")
 print(f"Response headers: {response.headers}")
-print(f"Response body: {json.dumps(response.json(), indent=2)}")
+response_data = decode_json(response)
+print_json("Response body", response_data)
 
 # Analyze the results
 if response.status_code == 200:
-    response_data = response.json()
     data = response_data.get("data", [])
     if data:
         print(f"\nFound LinkedIn URLs from {len(data)} jobs:")
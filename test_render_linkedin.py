@@ -1,7 +1,9 @@
-import requests
-import json
+from tests._http import SESSION, decode_json, print_json
+import sys
 
-# Test the LinkedIn URL extraction endpoint on Render.com
+# Test the LinkedIn URL extraction endpoint on Render.com, for a role listing
+# and a single job page unless URLs are given on the command line (pass
+# --verbose to print full response bodies)
 url = "https://weaver-backend.onrender.com/api/scrape/linkedin"
 headers = {
     "Content-Type": "application/json", 
@@ -9,55 +11,65 @@ headers = {
     "Accept": "application/json",
     "X-Requested-With": "XMLHttpRequest"
 }
-data = {"url": "https://www.ycombinator.com/companies/prelim/jobs/RzlfhQq-people-talent-lead"}
+DEFAULT_JOB_URLS = [
+    "https://www.ycombinator.com/jobs/role/sales-manager",
+    "https://www.ycombinator.com/companies/prelim/jobs/RzlfhQq-people-talent-lead"
+]
 
-print(f"Making request to {url}...")
-print(f"With headers: {headers}")
-response = requests.post(url, headers=headers, json=data)
-print(f"Status code: {response.status_code}")
-print(f"Response headers: {response.headers}")
-
-try:
-    response_data = response.json()
-    print(f"Response data keys: {list(response_data.keys())}")
+def check_linkedin_urls(job_url):
+    """Request LinkedIn URLs for one YC page and print what came back."""
+    data = {"url": job_url}
     
-    # Pretty print the response
-    print(f"Response body: {json.dumps(response_data, indent=2)}")
+    print(f"Making request to {url} for {job_url}...")
+    print(f"With headers: {headers}")
+    response = SESSION.post(url, headers=headers, json=data)
+    print(f"Status code: {response.status_code}")
+    print(f"Response headers: {response.headers}")
     
-    # Analyze the results
-    if response.status_code == 200:
-        data = response_data.get("data", [])
-        if data:
-            print(f"\nFound results from {len(data)} jobs:")
-            for i, job in enumerate(data):
-                print(f"\nJob {i+1}: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
-                print(f"Job URL: {job.get('job_url', '')}")
-                
-                # Check for founder LinkedIn URLs first
-                founder_urls = job.get('founder_linkedin_urls', [])
-                if founder_urls:
-                    print(f"Found {len(founder_urls)} FOUNDER LinkedIn URLs:")
-                    for j, linkedin_url in enumerate(founder_urls):
-                        print(f"  {j+1}. {linkedin_url}")
+    try:
+        response_data = decode_json(response)
+        print(f"Response data keys: {list(response_data.keys())}")
+        
+        # Pretty print the response
+        print_json("Response body", response_data)
+        
+        # Analyze the results
+        if response.status_code == 200:
+            data = response_data.get("data", [])
+            if data:
+                print(f"\nFound results from {len(data)} jobs:")
+                for i, job in enumerate(data):
+                    print(f"\nJob {i+1}: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
+                    print(f"Job URL: {job.get('job_url', '')}")
+                    
+                    # Check for founder LinkedIn URLs first
+                    founder_urls = job.get('founder_linkedin_urls', [])
+                    if founder_urls:
+                        print(f"Found {len(founder_urls)} FOUNDER LinkedIn URLs:")
+                        for j, linkedin_url in enumerate(founder_urls):
+                            print(f"  {j+1}. {linkedin_url}")
+                    
+                        # If there are founder names, show them
+                        founder_names = job.get('founder_names', [])
+                        if founder_names:
+                            print(f"Founder names: {', '.join(founder_names)}")
                     
-                    # If there are founder names, show them
-                    founder_names = job.get('founder_names', [])
-                    if founder_names:
-                        print(f"Founder names: {', '.join(founder_names)}")
-                
-                # Check for regular LinkedIn URLs as fallback
-                linkedin_urls = job.get('linkedin_urls', [])
-                if not founder_urls and linkedin_urls:
-                    print(f"Found {len(linkedin_urls)} LinkedIn URLs (not categorized):")
-                    for j, linkedin_url in enumerate(linkedin_urls):
-                        print(f"  {j+1}. {linkedin_url}")
-                
-                if not linkedin_urls and not founder_urls:
-                    print("No LinkedIn URLs found in this job")
+                    # Check for regular LinkedIn URLs as fallback
+                    linkedin_urls = job.get('linkedin_urls', [])
+                    if not founder_urls and linkedin_urls:
+                        print(f"Found {len(linkedin_urls)} LinkedIn URLs (not categorized):")
+                        for j, linkedin_url in enumerate(linkedin_urls):
+                            print(f"  {j+1}. {linkedin_url}")
+                    
+                    if not linkedin_urls and not founder_urls:
+                        print("No LinkedIn URLs found in this job")
+            else:
+                print("\nNo LinkedIn URLs found in any jobs")
         else:
-            print("\nNo LinkedIn URLs found in any jobs")
-    else:
-        print("\nERROR: Request failed!")
-except Exception as e:
-    print(f"Error parsing response: {e}")
-    print(f"Raw response: {response.text}") 
\ No newline at end of file
+            print("\nERROR: Request failed!")
+    except Exception as e:
+        print(f"Error parsing response: {e}")
+        print(f"Raw response: {response.text}")
+
+for job_url in [arg for arg in sys.argv[1:] if not arg.startswith('--')] or DEFAULT_JOB_URLS:
+    check_linkedin_urls(job_url)
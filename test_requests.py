@@ -1,11 +1,11 @@
-import requests
+from tests._http import SESSION
 
 def main():
     url = 'https://www.ycombinator.com/jobs/role/sales-manager'
     print(f"Testing URL access: {url}")
     
     try:
-        response = requests.get(url)
+        response = SESSION.get(url)
         print(f"Status code: {response.status_code}")
         print(f"Content length: {len(response.text)}")
         print("\nFirst 500 characters of response:")
@@ -4,7 +4,8 @@ Test script for the Y Combinator job scraper.
 
 import asyncio
 import json
-from app.scraper.scraper import YCombinatorScraper
+import sys
+from app.scraper.scraper import YCombinatorScraper, close_shared_browser
 import logging
 
 # Configure logging
@@ -15,19 +16,36 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-async def test_scraper():
-    """Test the scraper with a Y Combinator jobs URL."""
-    try:
-        # Initialize scraper
+# Scrapes allowed in flight at once, and how long any one of them may take
+MAX_CONCURRENT_SCRAPES = 8
+SCRAPE_TIMEOUT = 120
+
+async def scrape_bounded(url, semaphore):
+    """Scrape one URL, bounded by the semaphore and timeout."""
+    async with semaphore:
+        # Each scrape gets its own scraper; they share the browser, not state
         scraper = YCombinatorScraper()
+        logger.info(f"Starting test with URL: {url}")
+        return await asyncio.wait_for(scraper.scrape(url), timeout=SCRAPE_TIMEOUT)
+
+async def test_scraper(urls=None):
+    """Test the scraper with Y Combinator jobs URLs, scraped concurrently."""
+    # Test URL - Y Combinator software engineering jobs, unless URLs are given
+    urls = urls or ["https://www.ycombinator.com/jobs/role/software-engineer"]
+    try:
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
+        results_list = await asyncio.gather(
+            *(scrape_bounded(url, semaphore) for url in urls),
+            return_exceptions=True
+        )
         
-        # Test URL - Y Combinator software engineering jobs
-        test_url = "https://www.ycombinator.com/jobs/role/software-engineer"
-        
-        logger.info(f"Starting test with URL: {test_url}")
-        
-        # Run scraper
-        results = await scraper.scrape(test_url)
+        results = []
+        for url, url_results in zip(urls, results_list):
+            if isinstance(url_results, Exception):
+                logger.error(f"Error scraping {url}: {str(url_results)}")
+                continue
+            logger.info(f"Found {len(url_results)} jobs at {url}")
+            results.extend(url_results)
         
         # Log results
         logger.info(f"Found {len(results)} jobs")
@@ -49,6 +67,8 @@ async def test_scraper():
     except Exception as e:
         logger.error(f"Error during test: {str(e)}")
         raise
+    finally:
+        await close_shared_browser()
 
 if __name__ == "__main__":
-    asyncio.run(test_scraper()) 
\ No newline at end of file
+    asyncio.run(test_scraper(sys.argv[1:]))
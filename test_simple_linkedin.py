@@ -3,34 +3,53 @@ Simple test script to directly test LinkedIn URL extraction without going throug
 """
 import asyncio
 import sys
-from app.scraper.simple_scraper import extract_linkedin_urls
+from app.scraper.simple_scraper import extract_linkedin_urls, shutdown
+
+# Scrapes allowed in flight at once, and how long any one of them may take
+MAX_CONCURRENT_SCRAPES = 8
+SCRAPE_TIMEOUT = 120
+
+async def extract_bounded(url, semaphore):
+    """Extract LinkedIn URLs from one page, bounded by the semaphore and timeout."""
+    async with semaphore:
+        return await asyncio.wait_for(extract_linkedin_urls(url), timeout=SCRAPE_TIMEOUT)
 
 async def main():
-    """Run the scraper directly."""
-    if len(sys.argv) > 1:
-        url = sys.argv[1]
-    else:
-        url = "https://www.ycombinator.com/jobs/role/software-engineer"
+    """Run the scraper directly on every URL given, concurrently."""
+    urls = sys.argv[1:] or ["https://www.ycombinator.com/jobs/role/software-engineer"]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
     
-    print(f"Extracting LinkedIn URLs from {url}")
-    results = await extract_linkedin_urls(url)
+    print(f"Extracting LinkedIn URLs from {', '.join(urls)}")
+    try:
+        results_list = await asyncio.gather(
+            *(extract_bounded(url, semaphore) for url in urls),
+            return_exceptions=True
+        )
+    finally:
+        await shutdown()
     
-    if not results:
-        print("No LinkedIn URLs found.")
-        return
-    
-    print(f"\nFound LinkedIn URLs in {len(results)} job pages:")
-    for i, job in enumerate(results):
-        print(f"\nJob {i+1}: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
-        print(f"Job URL: {job.get('job_url', '')}")
+    for url, results in zip(urls, results_list):
+        print(f"\n=== {url} ===")
+        if isinstance(results, Exception):
+            print(f"Extraction failed: {results!r}")
+            continue
+        
+        if not results:
+            print("No LinkedIn URLs found.")
+            continue
         
-        linkedin_urls = job.get('linkedin_urls', [])
-        if linkedin_urls:
-            print(f"Found {len(linkedin_urls)} LinkedIn URLs:")
-            for j, linkedin_url in enumerate(linkedin_urls):
-                print(f"  {j+1}. {linkedin_url}")
-        else:
-            print("No LinkedIn URLs found in this job")
+        print(f"\nFound LinkedIn URLs in {len(results)} job pages:")
+        for i, job in enumerate(results):
+            print(f"\nJob {i+1}: {job.get('title', 'Unknown')} at {job.get('company', 'Unknown')}")
+            print(f"Job URL: {job.get('job_url', '')}")
+            
+            linkedin_urls = job.get('linkedin_urls', [])
+            if linkedin_urls:
+                print(f"Found {len(linkedin_urls)} LinkedIn URLs:")
+                for j, linkedin_url in enumerate(linkedin_urls):
+                    print(f"  {j+1}. {linkedin_url}")
+            else:
+                print("No LinkedIn URLs found in this job")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+Shared HTTP session and output helpers for the manual API scripts.
+"""
+
+import json
+import sys
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# One pooled session so a script's follow-up calls (progress polling after a
+# scrape request, say) reuse the connection and TLS session of the first
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+def decode_json(response):
+    """
+    Decode a response body with orjson rather than requests' stdlib json.
+    
+    Args:
+        response: Response whose body is JSON
+        
+    Returns:
+        The decoded body
+    """
+    return orjson.loads(response.content)
+
+# Full response bodies are only dumped when a script is run with --verbose
+VERBOSE = '--verbose' in sys.argv[1:]
+
+def print_json(label, data):
+    """
+    Pretty-print a decoded JSON body when running verbosely.
+    
+    The document is streamed to stdout rather than built into one string first.
+    
+    Args:
+        label: Text printed before the document
+        data: Decoded JSON to print
+    """
+    if not VERBOSE:
+        return
+    sys.stdout.write(f"{label}: ")
+    json.dump(data, sys.stdout, indent=2)
+    sys.stdout.write('\n')
@@ -15,9 +15,14 @@ sys.path.insert(0, str(root_dir))
 os.environ['FLASK_ENV'] = 'testing'
 os.environ['TESTING'] = 'true'
 
+@pytest.fixture(scope='session')
+def flask_app():
+    """Build the application once for the test session."""
+    from app import create_app
+    return create_app()
+
 @pytest.fixture(autouse=True)
-def app_context():
+def app_context(flask_app):
     """Create an app context for tests."""
-    from app import app
-    with app.app_context():
+    with flask_app.app_context():
         yield 
\ No newline at end of file
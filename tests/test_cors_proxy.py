@@ -0,0 +1,49 @@
+"""
+Tests for the CORS proxy's request checks and health cache.
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+# The proxy's dependencies live in requirements-cors-proxy.txt
+pytest.importorskip('gevent')
+import simple_cors_fix as proxy
+
+@pytest.fixture
+def client():
+    """Test client with an empty health cache."""
+    proxy.health_cache.update({'checked_at': float('-inf'), 'result': (b'', 500)})
+    return proxy.app.test_client()
+
+@pytest.mark.parametrize('body', ['not json', '', '[]', '{}', '{"url": ""}'])
+def test_scrape_without_url_is_rejected(client, body):
+    """Test that a body without a URL gets a 400 and never reaches the backend."""
+    with patch.object(proxy.SESSION, 'post') as post:
+        response = client.post('/api/scrape/linkedin', data=body, content_type='application/json')
+    
+    assert response.status_code == 400
+    assert response.get_json()['status'] == 'error'
+    assert not post.called
+
+def test_health_check_is_cached(client):
+    """Test that health results are reused for HEALTH_CACHE_TTL seconds."""
+    backend = MagicMock(status_code=200)
+    with patch.object(proxy.SESSION, 'get', return_value=backend) as get, \
+            patch.object(proxy, 'time') as clock:
+        clock.monotonic.return_value = 1000.0
+        assert client.get('/health').status_code == 200
+        clock.monotonic.return_value = 1000.0 + proxy.HEALTH_CACHE_TTL - 0.1
+        assert client.get('/health').status_code == 200
+        assert get.call_count == 1
+        
+        clock.monotonic.return_value = 1000.0 + proxy.HEALTH_CACHE_TTL
+        client.get('/health')
+        assert get.call_count == 2
+
+@pytest.mark.parametrize('headers', [{}, {'Origin': 'https://weaverai.vercel.app'}])
+def test_responses_vary_on_origin(client, headers):
+    """Test that responses with and without CORS headers are cached apart."""
+    response = client.get('/', headers=headers)
+    
+    assert 'Origin' in response.vary
+    assert ('Access-Control-Allow-Origin' in response.headers) == bool(headers)
@@ -0,0 +1,30 @@
+"""
+Tests for the CSV handling utilities.
+"""
+
+import csv
+from io import StringIO
+from app.utils.csv_handler import FIELDNAMES, get_csv_as_string
+
+def test_csv_columns_follow_fieldnames():
+    """Test that rows are written in FIELDNAMES order with missing fields left blank."""
+    output = get_csv_as_string([{'company': 'Acme', 'title': 'Engineer'}])
+    
+    rows = list(csv.reader(StringIO(output)))
+    
+    assert rows[0] == list(FIELDNAMES)
+    assert rows[1][FIELDNAMES.index('title')] == 'Engineer'
+    assert rows[1][FIELDNAMES.index('company')] == 'Acme'
+    assert rows[1].count('') == len(FIELDNAMES) - 2
+
+def test_csv_ignores_keys_outside_fieldnames():
+    """Test that keys not in FIELDNAMES are dropped instead of failing the export."""
+    output = get_csv_as_string([{'title': 'Engineer', 'linkedin_urls': 'https://linkedin.com/in/x'}])
+    
+    assert output is not None
+    assert 'linkedin' not in output
+    assert len(list(csv.reader(StringIO(output)))[1]) == len(FIELDNAMES)
+
+def test_csv_empty_data_returns_none():
+    """Test that an empty job list produces no CSV."""
+    assert get_csv_as_string([]) is None
@@ -2,8 +2,9 @@
 Tests for the retry handler utility.
 """
 
+import asyncio
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from app.utils.retry_handler import with_retry
 from app.config import Config
 
@@ -49,5 +50,40 @@ def test_exponential_backoff(mock_sleep):
     
     assert result == "success"
     assert mock_sleep.call_count == 2  # Called twice for the two retries
-    mock_sleep.assert_any_call(1.0)  # First retry
-    mock_sleep.assert_any_call(2.0)  # Second retry with exponential backoff 
\ No newline at end of file
+    first, second = (call.args[0] for call in mock_sleep.call_args_list)
+    # Each delay is the exponential step scaled by jitter in [0.5, 1.5)
+    assert 0.5 * Config.RETRY_DELAY <= first < 1.5 * Config.RETRY_DELAY  # First retry
+    assert Config.RETRY_DELAY <= second < 3 * Config.RETRY_DELAY  # Second retry with exponential backoff
+
+@patch('time.sleep')
+@patch('random.random', return_value=0.999)
+def test_backoff_is_capped(mock_random, mock_sleep):
+    """Test that no single backoff exceeds the configured ceiling."""
+    mock_func = Mock(side_effect=[ValueError, ValueError, "success"])
+    
+    # The schedule is built when the function is decorated
+    with patch.object(Config, 'RETRY_DELAY', 1000.0):
+        decorated_func = with_retry(mock_func)
+    decorated_func()
+    
+    assert all(call.args[0] <= Config.RETRY_MAX_DELAY for call in mock_sleep.call_args_list)
+
+@patch('time.sleep')
+@patch('asyncio.sleep', new_callable=AsyncMock)
+def test_async_retry_does_not_block(mock_async_sleep, mock_sleep):
+    """Test that coroutine functions back off with asyncio.sleep."""
+    calls = []
+    
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ValueError
+        return "success"
+    
+    decorated_func = with_retry(flaky)
+    
+    assert asyncio.iscoroutinefunction(decorated_func)
+    assert asyncio.run(decorated_func()) == "success"
+    assert len(calls) == 3
+    assert mock_async_sleep.await_count == 2
+    assert mock_sleep.call_count == 0
@@ -0,0 +1,127 @@
+"""
+Tests for the scraper's HTML and URL helpers.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+from selectolax.lexbor import LexborHTMLParser
+from app.scraper.scraper import (
+    MAX_BACKOFF, YCombinatorScraper, backoff_delay, canonical_job_url, first_text, is_blocked_host,
+    is_founder_url, validate_linkedin_url
+)
+from app.scraper.simple_scraper import linkedin_profile_urls
+from app.config import Config
+
+def test_canonical_job_url_resolves_and_strips():
+    """Test that relative job links are resolved and lose their query and fragment."""
+    base = 'https://www.ycombinator.com/jobs/role/software-engineer'
+    
+    assert canonical_job_url('/companies/acme/jobs/42?utm_source=x#apply', base) == \
+        'https://www.ycombinator.com/companies/acme/jobs/42'
+    assert canonical_job_url('https://acme.com/jobs/1', base) == 'https://acme.com/jobs/1'
+
+def test_is_blocked_host_matches_whole_labels():
+    """Test that tracker hosts and their subdomains are blocked, but look-alikes are not."""
+    assert is_blocked_host('segment.com')
+    assert is_blocked_host('cdn.segment.com')
+    assert not is_blocked_host('notsegment.com')
+    assert not is_blocked_host('myhotjar.com')
+    assert not is_blocked_host('')
+
+def test_validate_linkedin_url():
+    """Test that only linkedin.com URLs (any subdomain) are accepted."""
+    assert validate_linkedin_url('https://www.linkedin.com/in/jane') == 'https://www.linkedin.com/in/jane'
+    assert validate_linkedin_url('http://uk.LinkedIn.com/company/acme') == 'http://uk.LinkedIn.com/company/acme'
+    assert validate_linkedin_url('https://notlinkedin.com/in/jane') is None
+    assert validate_linkedin_url('https://example.com/?u=linkedin.com/') is None
+    assert validate_linkedin_url('') is None
+
+def test_first_text_keeps_inline_markup_spacing():
+    """Test that text split by inline tags keeps its spaces, like textContent.trim()."""
+    tree = LexborHTMLParser('<h1>\n  Senior <b>Backend</b> Engineer\n</h1>')
+    
+    assert first_text(tree, ['h1']) == 'Senior Backend Engineer'
+
+def test_first_text_falls_through_empty_matches():
+    """Test that a selector matching only whitespace falls through to the next one."""
+    tree = LexborHTMLParser('<h1> </h1><h2>Acme</h2>')
+    
+    assert first_text(tree, ['h1', 'h2']) == 'Acme'
+    assert first_text(tree, ['h3']) == ''
+
+def _fetch_details(html):
+    """Run the HTTP detail fetch against a canned page body."""
+    scraper = YCombinatorScraper()
+    scraper.http = MagicMock(get=AsyncMock(return_value=MagicMock(status_code=200, text=html)))
+    return asyncio.run(scraper._fetch_details_http('https://www.ycombinator.com/companies/acme/jobs/1'))
+
+def test_fetch_details_http_renders_js_shell():
+    """Test that a page whose only title is <title> is left for the browser render."""
+    assert _fetch_details('<title>YC Jobs</title><div id="__next"></div>') is None
+
+def test_fetch_details_http_reads_server_rendered_page():
+    """Test that a server-rendered page is extracted without a browser."""
+    details = _fetch_details('<title>YC Jobs</title><main><h1>Senior Engineer</h1></main>')
+    
+    assert details['title'] == 'Senior Engineer'
+    assert details['description'] == 'Senior Engineer'
+
+def _fetch_linkedin(html):
+    """Run the HTTP LinkedIn fetch against a canned page body."""
+    scraper = YCombinatorScraper()
+    scraper.http = MagicMock(get=AsyncMock(return_value=MagicMock(status_code=200, text=html)))
+    return asyncio.run(scraper._fetch_linkedin_http('https://www.ycombinator.com/companies/acme/jobs/1'))
+
+def test_fetch_linkedin_http_renders_without_founder_links():
+    """Test that a site-wide LinkedIn link alone leaves the page for the browser render."""
+    html = '<h1>Engineer</h1><footer><a href="https://www.linkedin.com/company/ycombinator">in</a></footer>'
+    
+    assert _fetch_linkedin(html) is None
+
+def test_fetch_linkedin_http_reads_founders_block():
+    """Test that founder links and names are split from company links."""
+    job = _fetch_linkedin(
+        '<h1>Engineer</h1>'
+        '<div class="Founders"><h3>Jane <span>Doe</span></h3>'
+        '<a href="https://www.linkedin.com/in/jane-doe">in</a></div>'
+        '<footer><a href="https://www.linkedin.com/company/acme">in</a></footer>'
+    )
+    
+    assert job['founder_names'] == ['Jane Doe']
+    assert job['founder_linkedin_urls'] == ['https://www.linkedin.com/in/jane-doe']
+    assert job['company_linkedin_urls'] == ['https://www.linkedin.com/company/acme']
+
+def test_is_founder_url():
+    """Test that founder names match URL slugs by any part longer than two characters."""
+    assert is_founder_url('https://linkedin.com/in/jane-doe-123', ['Jane Doe'])
+    assert is_founder_url('https://linkedin.com/in/JDOE', ['Jo Doe'])
+    assert not is_founder_url('https://linkedin.com/in/al-li', ['Al Li'])
+    assert not is_founder_url('https://linkedin.com/company/acme', ['Jane Doe', ''])
+
+def test_backoff_delay_honours_retry_after():
+    """Test that a numeric Retry-After is used as-is, up to the backoff ceiling."""
+    assert backoff_delay(0, '3') == 3.0
+    assert backoff_delay(0, '100000') == MAX_BACKOFF
+
+def test_backoff_delay_is_jittered_then_capped():
+    """Test that jitter stays within its bounds and never pushes a delay past the ceiling."""
+    with patch('app.utils.retry_handler.random.random', return_value=0.999):
+        assert backoff_delay(0) == Config.RETRY_DELAY * 1.499
+        assert backoff_delay(20, 'soon') == MAX_BACKOFF
+    with patch('app.utils.retry_handler.random.random', return_value=0.0):
+        assert backoff_delay(1) == Config.RETRY_DELAY * 2 * 0.5
+
+def test_linkedin_profile_urls_filters_and_dedups():
+    """Test that only person and company pages are kept, once each, in discovery order."""
+    hrefs = [
+        'https://www.linkedin.com/company/acme',
+        'https://www.linkedin.com/in/jane',
+        'https://www.linkedin.com/jobs/view/1',
+        'https://example.com/in/jane',
+        'https://www.linkedin.com/company/acme',
+    ]
+    
+    assert linkedin_profile_urls(hrefs) == [
+        'https://www.linkedin.com/company/acme',
+        'https://www.linkedin.com/in/jane',
+    ]
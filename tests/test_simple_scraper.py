@@ -0,0 +1,38 @@
+"""
+Tests for the simple LinkedIn scraper's HTTP path.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from app.scraper.simple_scraper import fetch_job_page_http
+
+JOB_URL = 'https://www.ycombinator.com/companies/acme/jobs/1'
+
+def _fetch(html):
+    """Run the HTTP fetch against a canned page body."""
+    response = MagicMock(content=html.encode(), text=html)
+    client = MagicMock(get=AsyncMock(return_value=response))
+    return asyncio.run(fetch_job_page_http(client, JOB_URL))
+
+def test_fetch_job_page_http_escaped_attribute_links():
+    """Test that links inside entity-escaped JSON attributes end at the entity."""
+    job = _fetch(
+        '<div data-page="{&quot;linkedin_url&quot;:&quot;https://www.linkedin.com/in/jane-doe&quot;,'
+        '&quot;name&quot;:&quot;Jane Doe&quot;}"></div>'
+    )
+    
+    assert job['linkedin_urls'] == ['https://www.linkedin.com/in/jane-doe']
+
+def test_fetch_job_page_http_keeps_inline_markup_spacing():
+    """Test that title and company text keep the spaces around inline tags."""
+    job = _fetch(
+        '<title>YC</title><h1>Senior <b>Backend</b> Engineer</h1><h2>Acme <b>Labs</b></h2>'
+        '<a href="https://www.linkedin.com/company/acme">LinkedIn</a>'
+    )
+    
+    assert job['title'] == 'Senior Backend Engineer'
+    assert job['company'] == 'Acme Labs'
+
+def test_fetch_job_page_http_without_links_needs_render():
+    """Test that a page with no LinkedIn links is left for the browser."""
+    assert _fetch('<h1>Engineer</h1>') is None